@@ -0,0 +1,139 @@
+"""WebSocket route and broadcaster for runtime events."""
+import asyncio
+from typing import Optional, Set
+
+import orjson
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+router = APIRouter(tags=["events"])
+
+# Clients are sent to in groups of this size so one slow socket
+# cannot hold up the others for long
+SEND_BATCH_SIZE = 50
+
+# Events arriving within this window (seconds) are sent as one frame;
+# a run_state superseded by a later one of the same run is dropped
+COALESCE_WINDOW = 0.015
+COALESCE_MAX_EVENTS = 128
+
+
+def _drop_superseded(events: list) -> list:
+    """Keep only the latest run_state per run, plus any carrying a node status."""
+    last_state = {}
+    for i, event in enumerate(events):
+        if event.get("type") == "run_state":
+            last_state[event.get("run_id")] = i
+    return [
+        event for i, event in enumerate(events)
+        if event.get("type") != "run_state"
+        or "node_status" in event
+        or last_state[event.get("run_id")] == i
+    ]
+
+
+class EventBus:
+    """Fans out runtime events to connected WebSocket clients."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._clients: Set[WebSocket] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._drainer: Optional[asyncio.Task] = None
+
+    async def connect(self, websocket: WebSocket):
+        """Register a connected client."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First client (or a new loop): bind the queue and drainer to it
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._drainer = loop.create_task(self._drain())
+        async with self._lock:
+            self._clients.add(websocket)
+
+    async def disconnect(self, websocket: WebSocket):
+        """Forget a client."""
+        async with self._lock:
+            self._clients.discard(websocket)
+
+    def emit(self, event: dict):
+        """Queue an event for publishing; safe to call from any thread."""
+        loop = self._loop
+        if loop is None:
+            # Nobody has ever connected
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._queue.put_nowait(event)
+        else:
+            loop.call_soon_threadsafe(self._queue.put_nowait, event)
+
+    async def _drain(self):
+        """Publish queued events, coalescing bursts into batch frames."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + COALESCE_WINDOW
+            while len(batch) < COALESCE_MAX_EVENTS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch = _drop_superseded(batch)
+            if len(batch) == 1:
+                await self.publish(batch[0])
+            else:
+                await self.publish({"type": "batch", "events": batch})
+
+    async def publish(self, event: dict):
+        """Send one event to every client."""
+        # Serialize once for all clients
+        payload = orjson.dumps(event).decode()
+
+        # Snapshot under the lock, send without holding it
+        async with self._lock:
+            clients = list(self._clients)
+
+        dead = []
+        for i in range(0, len(clients), SEND_BATCH_SIZE):
+            batch = clients[i:i + SEND_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(client.send_text(payload) for client in batch),
+                return_exceptions=True
+            )
+            dead.extend(
+                client for client, result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
+
+        if dead:
+            async with self._lock:
+                self._clients.difference_update(dead)
+
+
+# Global event bus instance
+bus = EventBus()
+
+
+@router.websocket("/ws/events")
+async def events_socket(websocket: WebSocket):
+    """Stream runtime events to a client."""
+    await websocket.accept()
+    await bus.connect(websocket)
+    try:
+        # Incoming messages are ignored; this only waits for disconnect
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await bus.disconnect(websocket)
@@ -1,17 +1,28 @@
 """API routes for execution control."""
 import asyncio
-import json
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
-from backend.runtime.executor import GraphExecutor, ExecutionState
-from backend.db.database import ProjectDatabase
+from backend.runtime.executor import GraphExecutor, ExecutionState, new_run_id
+from backend.db.pool import get_project_db
+from backend.api.events import bus
+from backend.runtime.paths import paths_for
 
 router = APIRouter(prefix="/run", tags=["execution"])
 
-# Global executor instance
-_executor: Optional[GraphExecutor] = None
+# Executors of recent runs, keyed by run_id (oldest first)
+_runs: Dict[str, GraphExecutor] = {}
+
+# Running graph tasks by run_id, referenced until they finish
+_run_tasks: Dict[str, asyncio.Task] = {}
+
+# Resolved project root of each running graph, so aliases of one path match
+_run_roots: Dict[str, Path] = {}
+
+# Finished runs kept around for /status lookups
+MAX_FINISHED_RUNS = 20
 
 
 class StartRequest(BaseModel):
@@ -23,51 +34,50 @@ class StartRequest(BaseModel):
 
 
 @router.post("/start_from_beginning")
-async def start_from_beginning(req: StartRequest, background_tasks: BackgroundTasks):
+async def start_from_beginning(req: StartRequest):
     """Start execution from beginning (Start node)."""
-    return await _start_execution(req, background_tasks)
+    return await _start_execution(req)
 
 
 @router.post("/start_from_selected")
-async def start_from_selected(req: StartRequest, background_tasks: BackgroundTasks):
+async def start_from_selected(req: StartRequest):
     """Start execution from selected node."""
-    return await _start_execution(req, background_tasks)
+    return await _start_execution(req)
 
 
-async def _start_execution(req: StartRequest, background_tasks: BackgroundTasks):
+async def _start_execution(req: StartRequest):
     """Internal execution start."""
-    global _executor
-    
-    if _executor and _executor.state == ExecutionState.RUNNING:
-        raise HTTPException(status_code=400, detail="Execution already in progress")
-    
     try:
+        paths = paths_for(req.path)
+        if paths.root in _run_roots.values():
+            raise HTTPException(status_code=400, detail="Execution already in progress")
+        
         # Load graph
-        db = ProjectDatabase(f"{req.path}/project.sqlite")
+        db = get_project_db(req.path)
         graph_json = db.load_graph(req.graph_name)
         
         if not graph_json:
             raise HTTPException(status_code=404, detail="Graph not found")
         
         # Create executor
-        log_path = f"{req.path}/log.txt"
-        _executor = GraphExecutor(req.path, log_path, event_callback=_broadcast_event)
+        log_path = str(paths.log)
+        executor = GraphExecutor(req.path, log_path, event_callback=_broadcast_event)
         
         # Start run
-        db_path = f"{req.path}/project.sqlite"
-        run_db = ProjectDatabase(db_path)
-        run_id = req.run_id or f"run_{__import__('datetime').datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        graph_id = run_db.get_graph_id(req.graph_name)
-        run_db.start_run(run_id, graph_id)
+        run_id = req.run_id or new_run_id()
+        if run_id in _runs:
+            raise HTTPException(status_code=400, detail="Run ID already in use")
+        graph_id = db.get_graph_id(req.graph_name)
+        db.start_run(run_id, graph_id)
+        _register_run(run_id, executor)
         
-        # Run in background
-        background_tasks.add_task(
-            _run_graph,
-            _executor,
-            graph_json,
-            req.node_uid,
-            req.from_beginning
+        # Run as its own task so it is not tied to this request
+        task = asyncio.create_task(
+            _run_graph(executor, graph_json, req.node_uid, req.from_beginning, run_id)
         )
+        _run_tasks[run_id] = task
+        _run_roots[run_id] = paths.root
+        task.add_done_callback(lambda _: _finish_task(run_id))
         
         return {"success": True, "run_id": run_id}
         
@@ -77,51 +87,83 @@ async def _start_execution(req: StartRequest, background_tasks: BackgroundTasks)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def _run_graph(executor: GraphExecutor, graph: dict, start_node: str, from_beginning: bool):
+async def _run_graph(executor: GraphExecutor, graph: dict, start_node: str,
+                     from_beginning: bool, run_id: str):
     """Run graph in background."""
-    await executor.execute(graph, start_node, from_beginning)
+    try:
+        await executor.execute(graph, start_node, from_beginning, run_id=run_id)
+    finally:
+        state = executor.state
+        status = state.value.lower() if state != ExecutionState.RUNNING else "error"
+        try:
+            get_project_db(executor.project_dir).finish_run(run_id, status)
+        except Exception as e:
+            executor.logger.error("Failed to record run result: %s", e, run_id=run_id)
+
+
+def _finish_task(run_id: str):
+    """Forget a run's task and project root once it is done."""
+    _run_tasks.pop(run_id, None)
+    _run_roots.pop(run_id, None)
+
+
+def _register_run(run_id: str, executor: GraphExecutor):
+    """Add a run to the registry, dropping the oldest finished runs."""
+    _runs[run_id] = executor
+    finished = [rid for rid in _runs if rid not in _run_tasks and rid != run_id]
+    for rid in finished[:max(0, len(finished) - MAX_FINISHED_RUNS)]:
+        del _runs[rid]
+
+
+def _get_run(run_id: Optional[str]) -> Optional[GraphExecutor]:
+    """Look up a run by ID, defaulting to the most recent one."""
+    if run_id is not None:
+        return _runs.get(run_id)
+    if _runs:
+        return _runs[next(reversed(_runs))]
+    return None
 
 
 @router.post("/stop_soft")
-def soft_stop():
+def soft_stop(run_id: Optional[str] = None):
     """Request soft stop."""
-    global _executor
-    if _executor:
-        _executor.soft_stop()
+    executor = _get_run(run_id)
+    if executor:
+        executor.soft_stop()
         return {"success": True}
     return {"success": False, "message": "No active execution"}
 
 
 @router.post("/stop_hard")
-def hard_stop():
+def hard_stop(run_id: Optional[str] = None):
     """Request hard stop."""
-    global _executor
-    if _executor:
-        _executor.hard_stop()
+    executor = _get_run(run_id)
+    if executor:
+        executor.hard_stop()
         return {"success": True}
     return {"success": False, "message": "No active execution"}
 
 
 @router.post("/resume")
-def resume():
+def resume(run_id: Optional[str] = None):
     """Resume from pause."""
-    global _executor
-    if _executor:
-        _executor.resume()
+    executor = _get_run(run_id)
+    if executor:
+        executor.resume()
         return {"success": True}
     return {"success": False, "message": "No active execution"}
 
 
 @router.get("/status")
-def get_status():
-    """Get current execution status."""
-    global _executor
-    if _executor:
+def get_status(run_id: Optional[str] = None):
+    """Get execution status of a run (the most recent one by default)."""
+    executor = _get_run(run_id)
+    if executor:
         return {
-            "state": _executor.state.value,
-            "run_id": _executor.current_run_id,
-            "active_node_uid": _executor.active_node_uid,
-            "active_node_title": _executor.active_node_title
+            "state": executor.state.value,
+            "run_id": executor.current_run_id,
+            "active_node_uid": executor.active_node_uid,
+            "active_node_title": executor.active_node_title
         }
     return {
         "state": ExecutionState.IDLE.value,
@@ -132,6 +174,5 @@ def get_status():
 
 
 def _broadcast_event(event: dict):
-    """Placeholder for event broadcasting (WebSocket would implement this)."""
-    # In real implementation, this would send to all connected WebSocket clients
-    print(f"Event: {json.dumps(event)}")
+    """Broadcast an executor event to WebSocket clients."""
+    bus.emit(event)
@@ -1,27 +1,53 @@
 """API routes for graph management."""
-import json
+import logging
+import operator
 import os
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Dict, List, Any
+from types import MappingProxyType
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
 
-from backend.db.database import ProjectDatabase
+from backend.db.pool import get_project_db
 
 router = APIRouter(prefix="/graph", tags=["graph"])
 
+log = logging.getLogger(__name__)
+
+# Accessors for validate_graph's per-edge loop; the shared read-only
+# default avoids allocating a {} for every edge without "data"
+_EMPTY = MappingProxyType({})
+_source_of = operator.methodcaller("get", "source")
+_data_of = operator.methodcaller("get", "data", _EMPTY)
+
 
 class GraphData(BaseModel):
     path: str
     name: str
-    graph_json: Dict[str, Any]
+    graph_json: dict
+
+
+def parse_body(model, body: bytes):
+    """Validate a raw JSON body with pydantic-core's parser, keeping FastAPI's 422."""
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+def body_schema(model) -> dict:
+    """OpenAPI requestBody for handlers that parse the raw body themselves."""
+    return {"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": model.model_json_schema()}},
+    }}
 
 
 @router.get("/load")
 def load_graph(path: str, name: str):
     """Load graph data."""
     try:
-        db_path = os.path.join(path, "project.sqlite")
-        db = ProjectDatabase(db_path)
+        db = get_project_db(path)
         graph_json = db.load_graph(name)
         
         if not graph_json:
@@ -34,31 +60,26 @@ def load_graph(path: str, name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/save")
-def save_graph(data: GraphData):
+@router.post("/save", openapi_extra=body_schema(GraphData))
+async def save_graph(request: Request):
     """Save graph data."""
-    print(f"Saving graph: path={repr(data.path)}, name={repr(data.name)}")
-    print(f"Directory exists: {os.path.exists(data.path)}")
-    print(f"graph_json type: {type(data.graph_json)}")
-    if data.graph_json:
-        print(f"graph_json keys: {list(data.graph_json.keys())}")
-    try:
-        db_path = os.path.join(data.path, "project.sqlite")
-        print(f"db_path: {db_path}")
-        try:
-            db = ProjectDatabase(db_path)
-            print("Database initialized successfully")
-        except Exception as e:
-            print(f"Failed to initialize database: {e}")
-            raise
+    # Graph payloads are large: parse the bytes directly instead of
+    # json.loads followed by dict validation
+    data = parse_body(GraphData, await request.body())
+    return await run_in_threadpool(_save_graph, data)
+
 
+def _save_graph(data: GraphData):
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Saving graph: path=%r, name=%r, directory exists: %s",
+                  data.path, data.name, os.path.exists(data.path))
+    try:
+        db = get_project_db(data.path)
         graph_id = db.save_graph(data.name, data.graph_json)
 
         return {"success": True, "graph_id": graph_id}
     except Exception as e:
-        print(f"Error saving graph: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error saving graph %r in %r", data.name, data.path)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -74,7 +95,7 @@ def validate_graph(data: GraphData):
         
         # Check for Start node when validating
         has_start = any(
-            n.get("data", {}).get("plugin_id") == "__start__"
+            _data_of(n).get("plugin_id") == "__start__"
             for n in nodes
         )
         
@@ -84,30 +105,27 @@ def validate_graph(data: GraphData):
                 "message": "No Start node found (required for 'Start from beginning')"
             })
         
-        # Check edge branches
-        ok_edges = {}
-        fail_edges = {}
-        
+        # Check edge branches: every repeat of a (source, branch kind) pair
+        # is reported where it occurs, in edge order
+        seen = set()
         for edge in edges:
-            source = edge.get("source")
-            branch = edge.get("data", {}).get("branch", "ok")
-            
-            if branch == "ok":
-                if source in ok_edges:
-                    errors.append({
-                        "node_uid": source,
-                        "error": "MULTIPLE_OK_EDGES",
-                        "message": "Node has multiple OK edges"
-                    })
-                ok_edges[source] = True
+            source = _source_of(edge)
+            is_ok = _data_of(edge).get("branch", "ok") == "ok"
+            key = (source, is_ok)
+            if key not in seen:
+                seen.add(key)
+            elif is_ok:
+                errors.append({
+                    "node_uid": source,
+                    "error": "MULTIPLE_OK_EDGES",
+                    "message": "Node has multiple OK edges"
+                })
             else:
-                if source in fail_edges:
-                    errors.append({
-                        "node_uid": source,
-                        "error": "MULTIPLE_FAIL_EDGES",
-                        "message": "Node has multiple FAIL edges"
-                    })
-                fail_edges[source] = True
+                errors.append({
+                    "node_uid": source,
+                    "error": "MULTIPLE_FAIL_EDGES",
+                    "message": "Node has multiple FAIL edges"
+                })
         
         return {
             "valid": len(errors) == 0,
@@ -1,29 +1,34 @@
 """API routes for logs."""
+import json
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from typing import Optional
 
-from backend.runtime.context import Logger
+from backend.runtime.context import get_logger
+from backend.runtime.paths import paths_for
 
 router = APIRouter(prefix="/log", tags=["logs"])
 
 
 @router.get("/tail")
 def get_log_tail(path: str, lines: int = 100, level: Optional[str] = None):
-    """Get last N lines from log file."""
-    log_path = f"{path}/log.txt"
-    logger = Logger(log_path)
+    """Stream last N lines from log file as NDJSON (one JSON string per line)."""
+    log_path = str(paths_for(path).log)
+    logger = get_logger(log_path)
     
-    tail_lines = logger.tail(lines, level)
+    def generate():
+        for line in logger.iter_tail(lines, level):
+            yield json.dumps(line) + "\n"
     
-    return {"lines": tail_lines}
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/tail_lines")
-def get_log_tail_lines(path: str, lines: int = 100):
+def get_log_tail_lines(path: str, lines: int = 100, level: Optional[str] = None):
     """Get last N lines from log file."""
-    log_path = f"{path}/log.txt"
-    logger = Logger(log_path)
+    log_path = str(paths_for(path).log)
+    logger = get_logger(log_path)
     
-    tail_lines = logger.tail(lines)
+    tail_lines = logger.tail(lines, level)
     
     return {"lines": tail_lines}
@@ -1,10 +1,11 @@
 """API routes for node settings."""
 import json
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 from typing import Dict, Any
 
-from backend.db.database import ProjectDatabase
+from backend.db.pool import get_project_db
 
 router = APIRouter(prefix="/nodes", tags=["nodes"])
 
@@ -20,14 +21,19 @@ class UpdateSettingsRequest(BaseModel):
 def get_node_settings(path: str, graph_name: str):
     """Get all node settings for a graph."""
     try:
-        db = ProjectDatabase(f"{path}/project.sqlite")
+        db = get_project_db(path)
         graph_id = db.get_graph_id(graph_name)
         
         if not graph_id:
             raise HTTPException(status_code=404, detail="Graph not found")
         
-        settings = db.get_node_settings(graph_id)
-        return {"settings": settings}
+        # Stored params/visual JSON is embedded as-is instead of being
+        # parsed and serialized again
+        settings = db.get_node_settings_raw(graph_id)
+        return Response(
+            content=orjson.dumps({"settings": settings}),
+            media_type="application/json"
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -38,7 +44,7 @@ def get_node_settings(path: str, graph_name: str):
 def update_node_settings(req: UpdateSettingsRequest):
     """Update settings for a specific node."""
     try:
-        db = ProjectDatabase(f"{req.path}/project.sqlite")
+        db = get_project_db(req.path)
         graph_id = db.get_graph_id(req.graph_name)
         
         if not graph_id:
@@ -63,14 +69,13 @@ class BatchUpdateRequest(BaseModel):
 def batch_update_settings(req: BatchUpdateRequest):
     """Batch update settings for multiple nodes."""
     try:
-        db = ProjectDatabase(f"{req.path}/project.sqlite")
+        db = get_project_db(req.path)
         graph_id = db.get_graph_id(req.graph_name)
         
         if not graph_id:
             raise HTTPException(status_code=404, detail="Graph not found")
         
-        for node_uid, settings in req.nodes.items():
-            db.save_node_settings(graph_id, node_uid, settings)
+        db.save_node_settings_bulk(graph_id, req.nodes.items())
         
         return {"success": True}
     except HTTPException:
@@ -1,15 +1,18 @@
 """API routes for plugins."""
-from fastapi import APIRouter
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Response
 from backend.plugins.loader import load_plugins, get_plugin_loader
 
 router = APIRouter(prefix="/plugins", tags=["plugins"])
 
 
-@router.get("")
-def get_plugins():
-    """Get list of available plugins."""
-    plugins = load_plugins()
-    return {
+@lru_cache(maxsize=1)
+def _plugins_payload() -> bytes:
+    """Build the serialized /plugins response from the loaded plugins."""
+    plugins = get_plugin_loader().get_all_plugins()
+    return orjson.dumps({
         "plugins": [
             {
                 "plugin_id": p["plugin_id"],
@@ -21,15 +24,14 @@ def get_plugins():
             }
             for p in plugins
         ]
-    }
+    })
 
 
-@router.get("/categories")
-def get_plugins_by_category():
-    """Get plugins grouped by category."""
-    loader = get_plugin_loader()
-    by_category = loader.get_plugins_by_category()
-    return {
+@lru_cache(maxsize=1)
+def _plugins_by_category_payload() -> bytes:
+    """Build the serialized /plugins/categories response from the loaded plugins."""
+    by_category = get_plugin_loader().get_plugins_by_category()
+    return orjson.dumps({
         "categories": [
             {
                 "name": cat,
@@ -49,4 +51,25 @@ def get_plugins_by_category():
             }
             for cat, plugins in by_category.items()
         ]
-    }
+    })
+
+
+@router.get("")
+def get_plugins():
+    """Get list of available plugins."""
+    return Response(content=_plugins_payload(), media_type="application/json")
+
+
+@router.get("/categories")
+def get_plugins_by_category():
+    """Get plugins grouped by category."""
+    return Response(content=_plugins_by_category_payload(), media_type="application/json")
+
+
+@router.post("/refresh")
+def refresh_plugins():
+    """Rediscover plugins and rebuild the cached catalog."""
+    plugins = load_plugins()
+    _plugins_payload.cache_clear()
+    _plugins_by_category_payload.cache_clear()
+    return {"success": True, "count": len(plugins)}
@@ -1,11 +1,15 @@
 """API routes for project management."""
 import os
 import json
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
-from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, Tuple
 
-from backend.db.database import ProjectDatabase
+from backend.api.graph import body_schema, parse_body
+from backend.db.pool import get_project_db
+from backend.runtime.paths import paths_for
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -28,31 +32,42 @@ class SaveProjectRequest(BaseModel):
 # Global state for current project
 _current_project_path = None
 
+# Bumped on every change of the current project; /state serves the
+# serialized payload cached for the current version
+_state_version = 0
+_state_cache: Tuple[int, bytes] = (-1, b"")
+
+
+def _empty_graph() -> dict:
+    """Graph saved into a newly created project."""
+    return {"nodes": [], "edges": [], "viewport": {"x": 0, "y": 0, "zoom": 1}}
+
+
+def _set_current_project(path: str):
+    """Switch the current project and invalidate the cached state."""
+    global _current_project_path, _state_version
+    _current_project_path = path
+    _state_version += 1
+
 
 @router.post("/create")
 def create_project(req: CreateProjectRequest):
     """Create a new project."""
     try:
         project_path = req.path
+        paths = paths_for(project_path)
         
         # Create directory structure
-        os.makedirs(project_path, exist_ok=True)
-        os.makedirs(os.path.join(project_path, "artifacts"), exist_ok=True)
+        os.makedirs(paths.artifacts, exist_ok=True)
         
         # Create log file
-        with open(os.path.join(project_path, "log.txt"), 'w') as f:
+        with open(paths.log, 'w') as f:
             pass
         
-        # Initialize database
-        db_path = os.path.join(req.path, "project.sqlite")
-        db = ProjectDatabase(db_path)
-        db.init_schema()
-        
-        # Save initial graph
-        db.save_graph(req.name, {"nodes": [], "edges": [], "viewport": {"x": 0, "y": 0, "zoom": 1}})
+        # Initialize database and save initial graph in one commit
+        get_project_db(req.path, populate=lambda db: db.save_graph(req.name, _empty_graph()))
         
-        global _current_project_path
-        _current_project_path = project_path
+        _set_current_project(project_path)
         
         return {
             "success": True,
@@ -71,15 +86,12 @@ def open_project(req: OpenProjectRequest):
             raise HTTPException(status_code=404, detail="Project not found")
 
         # Initialize database if not exists
-        db_path = os.path.join(req.path, "project.sqlite")
-        if not os.path.exists(db_path):
-            db = ProjectDatabase(db_path)
-            # Create initial graph
+        if not paths_for(req.path).db.exists():
+            # Create initial graph in the same commit as the schema
             graph_name = os.path.basename(req.path).replace('.botui', '')
-            db.save_graph(graph_name, {"nodes": [], "edges": [], "viewport": {"x": 0, "y": 0, "zoom": 1}})
+            get_project_db(req.path, populate=lambda db: db.save_graph(graph_name, _empty_graph()))
 
-        global _current_project_path
-        _current_project_path = req.path
+        _set_current_project(req.path)
 
         return {
             "success": True,
@@ -92,24 +104,34 @@ def open_project(req: OpenProjectRequest):
 
 
 @router.get("/state")
-def get_project_state():
+async def get_project_state():
     """Get current project state."""
-    global _current_project_path
-    if not _current_project_path:
-        return {"active": False}
+    global _state_cache
+    version, payload = _state_cache
+    if version != _state_version:
+        # Read the version before the path so a concurrent switch can
+        # only ever leave a stale version behind, never a stale payload
+        version = _state_version
+        path = _current_project_path
+        if not path:
+            payload = orjson.dumps({"active": False})
+        else:
+            payload = orjson.dumps({"active": True, "path": path})
+        _state_cache = (version, payload)
     
-    return {
-        "active": True,
-        "path": _current_project_path
-    }
+    return Response(content=payload, media_type="application/json")
 
 
-@router.post("/save")
-def save_project(req: SaveProjectRequest):
+@router.post("/save", openapi_extra=body_schema(SaveProjectRequest))
+async def save_project(request: Request):
     """Save project graph."""
+    req = parse_body(SaveProjectRequest, await request.body())
+    return await run_in_threadpool(_save_project, req)
+
+
+def _save_project(req: SaveProjectRequest):
     try:
-        db_path = os.path.join(req.path, "project.sqlite")
-        db = ProjectDatabase(db_path)
+        db = get_project_db(req.path)
         
         graph_id = db.save_graph(req.name, req.graph_json)
         
@@ -1,10 +1,10 @@
 """API routes for variables."""
-import json
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Any
 
-from backend.db.database import ProjectDatabase, AppDatabase
+from backend.db.database import loads_json
+from backend.db.pool import get_project_db, get_app_db
 
 router = APIRouter(prefix="/vars", tags=["variables"])
 
@@ -26,13 +26,13 @@ class SetVarRequest(BaseModel):
 def get_project_vars(path: str):
     """Get all project variables."""
     try:
-        db = ProjectDatabase(f"{path}/project.sqlite")
+        db = get_project_db(path)
         vars = db.get_project_vars()
         
         # Add value preview
         for v in vars:
             try:
-                v["value_preview"] = json.loads(v.get("value_json", "null"))
+                v["value_preview"] = loads_json(v.get("value_json", "null"))
             except:
                 v["value_preview"] = None
         
@@ -45,7 +45,7 @@ def get_project_vars(path: str):
 def create_project_var(req: CreateVarRequest):
     """Create a new project variable."""
     try:
-        db = ProjectDatabase(f"{req.path}/project.sqlite")
+        db = get_project_db(req.path)
         result = db.create_project_var(req.base_name, req.description)
         
         return {
@@ -61,7 +61,7 @@ def create_project_var(req: CreateVarRequest):
 def set_project_var_value(path: str, var_id: int, value: Any):
     """Set project variable value."""
     try:
-        db = ProjectDatabase(f"{path}/project.sqlite")
+        db = get_project_db(path)
         db.set_project_var_value(var_id, value)
         return {"success": True}
     except Exception as e:
@@ -74,12 +74,12 @@ def set_project_var_value(path: str, var_id: int, value: Any):
 def get_global_vars(path: str):
     """Get all global variables."""
     try:
-        db = AppDatabase(f"{path}/../app.sqlite")
+        db = get_app_db(path)
         vars = db.get_global_vars()
         
         for v in vars:
             try:
-                v["value_preview"] = json.loads(v.get("value_json", "null"))
+                v["value_preview"] = loads_json(v.get("value_json", "null"))
             except:
                 v["value_preview"] = None
         
@@ -92,7 +92,7 @@ def get_global_vars(path: str):
 def create_global_var(req: CreateVarRequest):
     """Create a new global variable."""
     try:
-        db = AppDatabase(f"{req.path}/../app.sqlite")
+        db = get_app_db(req.path)
         result = db.create_global_var(req.base_name, req.description)
         
         return {
@@ -108,7 +108,7 @@ def create_global_var(req: CreateVarRequest):
 def set_global_var_value(path: str, var_id: int, value: Any):
     """Set global variable value."""
     try:
-        db = AppDatabase(f"{path}/../app.sqlite")
+        db = get_app_db(path)
         db.set_global_var_value(var_id, value)
         return {"success": True}
     except Exception as e:
@@ -123,11 +123,11 @@ def get_variable(ref: str, path: str):
     try:
         if ref.startswith("proj:"):
             var_id = int(ref[5:])
-            db = ProjectDatabase(f"{path}/project.sqlite")
+            db = get_project_db(path)
             var = db.get_project_var(var_id)
         elif ref.startswith("glob:"):
             var_id = int(ref[5:])
-            db = AppDatabase(f"{path}/../app.sqlite")
+            db = get_app_db(path)
             var = db.get_global_var(var_id)
         else:
             raise HTTPException(status_code=400, detail="Invalid ref format")
@@ -135,7 +135,7 @@ def get_variable(ref: str, path: str):
         if not var:
             raise HTTPException(status_code=404, detail="Variable not found")
         
-        return {"value": json.loads(var.get("value_json", "null"))}
+        return {"value": loads_json(var.get("value_json", "null"))}
     except HTTPException:
         raise
     except Exception as e:
@@ -148,11 +148,11 @@ def set_variable(req: SetVarRequest, path: str):
     try:
         if req.ref.startswith("proj:"):
             var_id = int(req.ref[5:])
-            db = ProjectDatabase(f"{path}/project.sqlite")
+            db = get_project_db(path)
             db.set_project_var_value(var_id, req.value)
         elif req.ref.startswith("glob:"):
             var_id = int(req.ref[5:])
-            db = AppDatabase(f"{path}/../app.sqlite")
+            db = get_app_db(path)
             db.set_global_var_value(var_id, req.value)
         else:
             raise HTTPException(status_code=400, detail="Invalid ref format")
@@ -1,10 +1,180 @@
 """Database module for SQLite operations."""
 import sqlite3
 import json
+import logging
 import os
-from typing import Any, Dict, List, Optional
+import orjson
+import queue
+import re
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from contextlib import contextmanager
-from datetime import datetime
+
+log = logging.getLogger(__name__)
+
+# Per-connection settings. WAL lets readers proceed while a write is in
+# progress, and synchronous=NORMAL in WAL mode only fsyncs at checkpoints.
+_COMMON_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+"""
+_WRITER_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+""" + _COMMON_PRAGMAS
+_READER_PRAGMAS = """
+    PRAGMA query_only=1;
+""" + _COMMON_PRAGMAS
+
+_NODE_SETTINGS_UPSERT = """
+    INSERT OR REPLACE INTO node_settings 
+    (graph_id, node_uid, plugin_id, params_json, input_var_ref, output_var_ref, 
+     error_to_fail, breakpoint, visual_json, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Runs of digits long enough to be an integer outside orjson's 64-bit range,
+# which it would decode as a float and lose precision
+_LONG_DIGITS = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Decode stored JSON with orjson, falling back to the json module.
+    
+    Rows written by json.dumps may hold NaN/Infinity, which orjson rejects,
+    or integers wider than 64 bits, which it would turn into floats.
+    """
+    long_digits = _LONG_DIGITS_BYTES if isinstance(data, (bytes, bytearray, memoryview)) else _LONG_DIGITS
+    if not long_digits.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# JSON for TEXT columns. Reads decode in the driver: connections use
+# PARSE_COLNAMES, so a column aliased as "name [JSON]" comes back already
+# parsed. Writes go through _dumps, since values may be any JSON type
+# (a plain string must still be stored quoted); non-string keys are
+# converted to strings, as json.dumps does.
+sqlite3.register_converter("JSON", loads_json)
+
+
+def _as_is(value: Any) -> Any:
+    """Return a value already decoded by the JSON converter."""
+    return value
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string."""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # Integers wider than 64 bits; json raises TypeError itself for
+        # values neither library can serialize
+        return json.dumps(value)
+
+
+# (second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp from _now_iso()
+_iso_cache = (-1, "")
+
+
+def _now_iso() -> str:
+    """Local time in isoformat() with microseconds, formatting the date part once per second."""
+    global _iso_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _iso_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+# SQL shared by several methods. All statements are constant strings so
+# the per-connection statement cache (cached_statements) always hits.
+_GRAPH_ID_BY_NAME = "SELECT graph_id FROM graphs WHERE name = ?"
+_GRAPH_UPSERT = """
+    INSERT INTO graphs (name, graph_json, updated_at) VALUES (?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        graph_json = excluded.graph_json,
+        updated_at = excluded.updated_at
+"""
+_GRAPH_UPSERT_RETURNING = _GRAPH_UPSERT + " RETURNING graph_id"
+
+# UPSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_NODE_SETTINGS_SELECT = """
+    SELECT node_uid, plugin_id, params_json, input_var_ref, output_var_ref,
+           error_to_fail, breakpoint, COALESCE(visual_json, '{}') AS visual_json,
+           updated_at
+    FROM node_settings WHERE graph_id = ?
+"""
+# Same columns with params/visual decoded by the JSON converter
+_NODE_SETTINGS_SELECT_DECODED = """
+    SELECT node_uid, plugin_id, params_json AS "params_json [JSON]",
+           input_var_ref, output_var_ref, error_to_fail, breakpoint,
+           COALESCE(visual_json, '{}') AS "visual_json [JSON]", updated_at
+    FROM node_settings WHERE graph_id = ?
+"""
+
+# Result keys of the variable queries, in their SELECT column order;
+# rows are zipped positionally instead of looked up by name
+_VAR_FIELDS = ("var_id", "base_name", "title", "description", "value_json", "updated_at")
+
+# Graphs are stored as zlib-compressed JSON BLOBs; rows written before
+# compression was introduced are plain TEXT and are still readable.
+_GRAPH_COMPRESS_LEVEL = 3
+
+
+class ReadPool:
+    """Pool of read-only connections to one database file."""
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int):
+        self._connect = connect
+        self._size = size
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection for the duration of the block."""
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+    
+    def close(self):
+        """Close every idle connection; later checkouts open fresh ones."""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._created -= 1
+    
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one while below size."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                conn = self._connect()
+                self._created += 1
+                return conn
+        return self._idle.get()
 
 
 class Database:
@@ -12,21 +182,121 @@ class Database:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._ensure_db_exists()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Thread currently inside a get_connection() block, if any
+        self._owner: Optional[int] = None
+        self._readers = ReadPool(
+            lambda: self._connect(query_only=True),
+            size=os.cpu_count() or 4
+        )
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    @classmethod
+    def ensure_ready(cls, db_path: str,
+                     populate: Optional[Callable[["Database"], None]] = None) -> "Database":
+        """
+        Open a handle, creating the file and schema if needed.
+        
+        populate, if given, runs in the same transaction as the schema, so
+        initial rows are committed together with it or not at all.
+        
+        This is done once per file; application code should use the shared
+        handles from backend.db.pool rather than constructing its own.
+        """
+        db = cls(db_path)
         try:
-            yield conn
-            conn.commit()
+            db._ensure_db_exists()
+            with db.transaction():
+                db.init_schema()
+                if populate is not None:
+                    populate(db)
         except Exception:
-            conn.rollback()
+            db.close()
             raise
-        finally:
-            conn.close()
+        return db
+    
+    def init_schema(self):
+        """Initialize database schema (none for the base class)."""
+    
+    @staticmethod
+    def _configure(conn: sqlite3.Connection, query_only: bool = False):
+        """Apply per-connection PRAGMAs; called once right after connecting."""
+        conn.executescript(_READER_PRAGMAS if query_only else _WRITER_PRAGMAS)
+    
+    def _connect(self, query_only: bool = False) -> sqlite3.Connection:
+        """Open a connection and apply PRAGMAs once."""
+        # Connections are long-lived, so keep enough prepared statements to
+        # cover every query the app issues
+        # isolation_level=None: transactions are begun explicitly by
+        # get_connection()/transaction() rather than by the sqlite3 module
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            detect_types=sqlite3.PARSE_COLNAMES,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn, query_only)
+        return conn
+    
+    @contextmanager
+    def _write_block(self, begin: str):
+        """Hold the writer for a block, wrapping the outermost one in a transaction."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            if self._owner is not None:
+                yield conn
+                return
+            self._owner = threading.get_ident()
+            try:
+                conn.execute(begin)
+                yield conn
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._owner = None
+    
+    def get_connection(self):
+        """
+        Context manager for the shared database connection.
+        
+        Nested blocks on the same thread join the outermost one, which
+        commits or rolls back everything at once.
+        """
+        return self._write_block("BEGIN")
+    
+    def transaction(self):
+        """Group several calls into one write transaction, taking the write lock up front."""
+        return self._write_block("BEGIN IMMEDIATE")
+    
+    @contextmanager
+    def read_connection(self):
+        """
+        Context manager for a pooled read-only connection.
+        
+        Inside a write block on this thread, reads use the writer so they
+        see the uncommitted changes.
+        """
+        if self._owner == threading.get_ident():
+            yield self._conn
+            return
+        with self._readers.acquire() as conn:
+            yield conn
+    
+    def close(self):
+        """Close the writer and all pooled reader connections."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._readers.close()
     
     def _ensure_db_exists(self):
         """Create database file if not exists."""
@@ -42,13 +312,13 @@ class Database:
     
     def fetch_one(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
         """Fetch one row."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.execute(query, params)
             return cursor.fetchone()
     
     def fetch_all(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """Fetch all rows."""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.execute(query, params)
             return cursor.fetchall()
     
@@ -64,7 +334,7 @@ class AppDatabase(Database):
     
     def init_schema(self):
         """Initialize database schema."""
-        with self.get_connection() as conn:
+        with self.transaction() as conn:
             # App settings
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS app_settings (
@@ -97,17 +367,17 @@ class AppDatabase(Database):
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
         row = self.fetch_one(
-            "SELECT value_json FROM app_settings WHERE key = ?",
+            'SELECT value_json AS "value_json [JSON]" FROM app_settings WHERE key = ?',
             (key,)
         )
         if row:
-            return json.loads(row["value_json"])
+            return row["value_json"]
         return default
     
     def set_setting(self, key: str, value: Any):
         """Set a setting value."""
-        value_json = json.dumps(value)
-        now = datetime.now().isoformat()
+        value_json = _dumps(value)
+        now = _now_iso()
         self.execute(
             "INSERT OR REPLACE INTO app_settings (key, value_json, updated_at) VALUES (?, ?, ?)",
             (key, value_json, now)
@@ -116,8 +386,8 @@ class AppDatabase(Database):
     # Global variables
     def create_global_var(self, base_name: str, description: str = "") -> Dict:
         """Create a new global variable."""
-        now = datetime.now().isoformat()
-        with self.get_connection() as conn:
+        now = _now_iso()
+        with self.transaction() as conn:
             cursor = conn.execute(
                 "INSERT INTO global_vars_def (base_name, title, description, created_at) VALUES (?, ?, ?, ?)",
                 (base_name, "", description, now)
@@ -147,26 +417,17 @@ class AppDatabase(Database):
             FROM global_vars_def v_def
             JOIN global_vars_val v_val ON v_def.var_id = v_val.var_id
         """)
-        return [
-            {
-                "var_id": row["var_id"],
-                "base_name": row["base_name"],
-                "title": row["title"],
-                "description": row["description"],
-                "value_json": row["value_json"],
-                "updated_at": row["updated_at"]
-            }
-            for row in rows
-        ]
+        return [dict(zip(_VAR_FIELDS, row)) for row in rows]
     
-    def set_global_var_value(self, var_id: int, value: Any):
-        """Set global variable value."""
-        value_json = json.dumps(value)
-        now = datetime.now().isoformat()
-        self.execute(
+    def set_global_var_value(self, var_id: int, value: Any) -> Optional[str]:
+        """Set global variable value and return the stored JSON (None if no such variable)."""
+        value_json = _dumps(value)
+        now = _now_iso()
+        cursor = self.execute(
             "UPDATE global_vars_val SET value_json = ?, updated_at = ? WHERE var_id = ?",
             (value_json, now, var_id)
         )
+        return value_json if cursor.rowcount == 1 else None
     
     def get_global_var(self, var_id: int) -> Optional[Dict]:
         """Get a specific global variable."""
@@ -178,27 +439,16 @@ class AppDatabase(Database):
             WHERE v_def.var_id = ?
         """, (var_id,))
         if row:
-            return {
-                "var_id": row["var_id"],
-                "base_name": row["base_name"],
-                "title": row["title"],
-                "description": row["description"],
-                "value_json": row["value_json"],
-                "updated_at": row["updated_at"]
-            }
+            return dict(zip(_VAR_FIELDS, row))
         return None
 
 
 class ProjectDatabase(Database):
     """Project database (project.sqlite)."""
 
-    def __init__(self, db_path: str):
-        super().__init__(db_path)
-        self.init_schema()
-
     def init_schema(self):
         """Initialize database schema."""
-        with self.get_connection() as conn:
+        with self.transaction() as conn:
             # Graphs
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS graphs (
@@ -257,35 +507,40 @@ class ProjectDatabase(Database):
                     error_message TEXT
                 )
             """)
+            
+            # One row per graph name. Older files could hold duplicates
+            # from racing saves; keep the first, which is the one lookups used
+            conn.execute("""
+                DELETE FROM graphs WHERE graph_id NOT IN (
+                    SELECT MIN(graph_id) FROM graphs GROUP BY name
+                )
+            """)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_graphs_name ON graphs(name)"
+            )
+            
+            # get_runs() lists newest first
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at DESC)"
+            )
     
     # Graphs
     def save_graph(self, name: str, graph_json: Dict) -> int:
         """Save or update graph."""
-        now = datetime.now().isoformat()
+        now = _now_iso()
         try:
-            graph_json_str = json.dumps(graph_json)
+            payload = zlib.compress(orjson.dumps(graph_json), _GRAPH_COMPRESS_LEVEL)
         except Exception as e:
-            print(f"Cannot serialize graph_json: {e}, type: {type(graph_json)}")
+            log.error("Cannot serialize graph_json: %s, type: %s", e, type(graph_json))
             raise
         
-        # Check if graph exists
-        existing = self.fetch_one(
-            "SELECT graph_id FROM graphs WHERE name = ?",
-            (name,)
-        )
-        
-        if existing:
-            self.execute(
-                "UPDATE graphs SET graph_json = ?, updated_at = ? WHERE name = ?",
-                (graph_json_str, now, name)
-            )
-            return existing["graph_id"]
-        else:
-            cursor = self.execute(
-                "INSERT INTO graphs (name, graph_json, updated_at) VALUES (?, ?, ?)",
-                (name, graph_json_str, now)
-            )
-            return cursor.lastrowid
+        # One statement whether the graph is new or not; relies on the
+        # unique index on graphs(name)
+        with self.get_connection() as conn:
+            if _HAS_RETURNING:
+                return conn.execute(_GRAPH_UPSERT_RETURNING, (name, payload, now)).fetchone()[0]
+            conn.execute(_GRAPH_UPSERT, (name, payload, now))
+            return conn.execute(_GRAPH_ID_BY_NAME, (name,)).fetchone()[0]
     
     def load_graph(self, name: str) -> Optional[Dict]:
         """Load graph by name."""
@@ -294,65 +549,83 @@ class ProjectDatabase(Database):
             (name,)
         )
         if row:
-            return json.loads(row["graph_json"])
+            data = row["graph_json"]
+            if isinstance(data, bytes):
+                data = zlib.decompress(data)
+            return loads_json(data)
         return None
     
     def get_graph_id(self, name: str) -> Optional[int]:
         """Get graph ID by name."""
-        row = self.fetch_one(
-            "SELECT graph_id FROM graphs WHERE name = ?",
-            (name,)
-        )
+        row = self.fetch_one(_GRAPH_ID_BY_NAME, (name,))
         return row["graph_id"] if row else None
     
     # Node settings
+    def _node_settings_row(self, graph_id: int, node_uid: str,
+                           settings: Dict, now: str) -> tuple:
+        """Build the node_settings row for one node."""
+        return (
+            graph_id, node_uid, settings.get("plugin_id", ""),
+            _dumps(settings.get("params", {})),
+            settings.get("input_var_ref"),
+            settings.get("output_var_ref"),
+            1 if settings.get("error_to_fail") else 0,
+            1 if settings.get("breakpoint") else 0,
+            _dumps(settings.get("visual", {})),
+            now
+        )
+    
     def save_node_settings(self, graph_id: int, node_uid: str, settings: Dict):
         """Save node settings."""
-        now = datetime.now().isoformat()
-        
-        params_json = json.dumps(settings.get("params", {}))
-        input_var_ref = settings.get("input_var_ref")
-        output_var_ref = settings.get("output_var_ref")
-        error_to_fail = 1 if settings.get("error_to_fail") else 0
-        breakpoint = 1 if settings.get("breakpoint") else 0
-        visual_json = json.dumps(settings.get("visual", {}))
-        
-        self.execute("""
-            INSERT OR REPLACE INTO node_settings 
-            (graph_id, node_uid, plugin_id, params_json, input_var_ref, output_var_ref, 
-             error_to_fail, breakpoint, visual_json, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            graph_id, node_uid, settings.get("plugin_id", ""),
-            params_json, input_var_ref, output_var_ref,
-            error_to_fail, breakpoint, visual_json, now
-        ))
+        now = _now_iso()
+        self.execute(
+            _NODE_SETTINGS_UPSERT,
+            self._node_settings_row(graph_id, node_uid, settings, now)
+        )
+    
+    def save_node_settings_bulk(self, graph_id: int, items: Iterable[Tuple[str, Dict]]):
+        """Save settings for several nodes with one executemany in a single transaction."""
+        now = _now_iso()
+        rows = [
+            self._node_settings_row(graph_id, node_uid, settings, now)
+            for node_uid, settings in items
+        ]
+        with self.transaction() as conn:
+            conn.executemany(_NODE_SETTINGS_UPSERT, rows)
     
     def get_node_settings(self, graph_id: int) -> Dict[str, Dict]:
         """Get all node settings for a graph."""
-        rows = self.fetch_all(
-            "SELECT * FROM node_settings WHERE graph_id = ?",
-            (graph_id,)
-        )
+        return self._node_settings(_NODE_SETTINGS_SELECT_DECODED, graph_id, _as_is)
+    
+    def get_node_settings_raw(self, graph_id: int) -> Dict[str, Dict]:
+        """Get node settings with params/visual left as orjson.Fragment for passthrough."""
+        return self._node_settings(_NODE_SETTINGS_SELECT, graph_id, orjson.Fragment)
+    
+    def _node_settings(self, sql: str, graph_id: int,
+                       decode: Callable[[Any], Any]) -> Dict[str, Dict]:
+        """Build node settings dicts, passing the JSON columns through decode."""
+        rows = self.fetch_all(sql, (graph_id,))
         result = {}
-        for row in rows:
-            result[row["node_uid"]] = {
-                "plugin_id": row["plugin_id"],
-                "params": json.loads(row["params_json"]),
-                "input_var_ref": row["input_var_ref"],
-                "output_var_ref": row["output_var_ref"],
-                "error_to_fail": bool(row["error_to_fail"]),
-                "breakpoint": bool(row["breakpoint"]),
-                "visual": json.loads(row["visual_json"] or "{}"),
-                "updated_at": row["updated_at"]
+        # Unpack by position (column order of the node settings SELECTs)
+        for (node_uid, plugin_id, params_json, input_var_ref, output_var_ref,
+             error_to_fail, is_breakpoint, visual_json, updated_at) in rows:
+            result[node_uid] = {
+                "plugin_id": plugin_id,
+                "params": decode(params_json),
+                "input_var_ref": input_var_ref,
+                "output_var_ref": output_var_ref,
+                "error_to_fail": bool(error_to_fail),
+                "breakpoint": bool(is_breakpoint),
+                "visual": decode(visual_json),
+                "updated_at": updated_at
             }
         return result
     
     # Project variables
     def create_project_var(self, base_name: str, description: str = "") -> Dict:
         """Create a new project variable."""
-        now = datetime.now().isoformat()
-        with self.get_connection() as conn:
+        now = _now_iso()
+        with self.transaction() as conn:
             cursor = conn.execute(
                 "INSERT INTO project_vars_def (base_name, title, description, created_at) VALUES (?, ?, ?, ?)",
                 (base_name, "", description, now)
@@ -382,26 +655,17 @@ class ProjectDatabase(Database):
             FROM project_vars_def v_def
             JOIN project_vars_val v_val ON v_def.var_id = v_val.var_id
         """)
-        return [
-            {
-                "var_id": row["var_id"],
-                "base_name": row["base_name"],
-                "title": row["title"],
-                "description": row["description"],
-                "value_json": row["value_json"],
-                "updated_at": row["updated_at"]
-            }
-            for row in rows
-        ]
+        return [dict(zip(_VAR_FIELDS, row)) for row in rows]
     
-    def set_project_var_value(self, var_id: int, value: Any):
-        """Set project variable value."""
-        value_json = json.dumps(value)
-        now = datetime.now().isoformat()
-        self.execute(
+    def set_project_var_value(self, var_id: int, value: Any) -> Optional[str]:
+        """Set project variable value and return the stored JSON (None if no such variable)."""
+        value_json = _dumps(value)
+        now = _now_iso()
+        cursor = self.execute(
             "UPDATE project_vars_val SET value_json = ?, updated_at = ? WHERE var_id = ?",
             (value_json, now, var_id)
         )
+        return value_json if cursor.rowcount == 1 else None
     
     def get_project_var(self, var_id: int) -> Optional[Dict]:
         """Get a specific project variable."""
@@ -413,20 +677,13 @@ class ProjectDatabase(Database):
             WHERE v_def.var_id = ?
         """, (var_id,))
         if row:
-            return {
-                "var_id": row["var_id"],
-                "base_name": row["base_name"],
-                "title": row["title"],
-                "description": row["description"],
-                "value_json": row["value_json"],
-                "updated_at": row["updated_at"]
-            }
+            return dict(zip(_VAR_FIELDS, row))
         return None
     
     # Runs
     def start_run(self, run_id: str, graph_id: int):
         """Start a new run."""
-        now = datetime.now().isoformat()
+        now = _now_iso()
         self.execute(
             "INSERT INTO runs (run_id, graph_id, status, started_at) VALUES (?, ?, ?, ?)",
             (run_id, graph_id, "running", now)
@@ -434,7 +691,7 @@ class ProjectDatabase(Database):
     
     def finish_run(self, run_id: str, status: str, error_message: str = None):
         """Finish a run."""
-        now = datetime.now().isoformat()
+        now = _now_iso()
         self.execute(
             "UPDATE runs SET status = ?, finished_at = ?, error_message = ? WHERE run_id = ?",
             (status, now, error_message, run_id)
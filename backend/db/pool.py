@@ -0,0 +1,61 @@
+"""Process-wide cache of database handles."""
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from backend.runtime.paths import paths_for
+from .database import AppDatabase, Database, ProjectDatabase
+
+_lock = threading.Lock()
+
+# Open handles by database file, least recently used first. Past
+# MAX_HANDLES the oldest is closed; a closed handle still works and
+# reopens its connections on next use, so evicting one in use is safe.
+MAX_HANDLES = 64
+_handles: "OrderedDict[str, Database]" = OrderedDict()
+
+
+def _get(db_path: str, factory: Callable[..., Database],
+         populate: Optional[Callable[[Database], None]] = None) -> Database:
+    evicted: List[Database] = []
+    with _lock:
+        db = _handles.get(db_path)
+        if db is None:
+            # First open: populate shares the schema transaction
+            db = _handles[db_path] = factory(db_path, populate)
+            while len(_handles) > MAX_HANDLES:
+                evicted.append(_handles.popitem(last=False)[1])
+            populate = None
+        else:
+            _handles.move_to_end(db_path)
+    for old in evicted:
+        old.close()
+    if populate is not None:
+        with db.transaction():
+            populate(db)
+    return db
+
+
+def get_project_db(path: str,
+                   populate: Optional[Callable[[ProjectDatabase], None]] = None) -> ProjectDatabase:
+    """
+    Get the shared project database for a project directory.
+    
+    populate, if given, writes initial rows atomically: in the schema
+    transaction when the file is first opened, otherwise in its own.
+    """
+    return _get(str(paths_for(path).db), ProjectDatabase.ensure_ready, populate)
+
+
+def get_app_db(path: str) -> AppDatabase:
+    """Get the shared app database living next to a project directory."""
+    return _get(str(paths_for(path).app_db), AppDatabase.ensure_ready)
+
+
+def close_all():
+    """Close every cached handle (called on application shutdown)."""
+    with _lock:
+        handles = list(_handles.values())
+        _handles.clear()
+    for db in handles:
+        db.close()
@@ -1,9 +1,10 @@
 """Main FastAPI application."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
-from backend.api import plugins, projects, graph, nodes, variables, execution, logs
+from backend.api import plugins, projects, graph, nodes, variables, execution, logs, events
 
 
 @asynccontextmanager
@@ -13,13 +14,19 @@ async def lifespan(app: FastAPI):
     from backend.plugins.loader import load_plugins
     load_plugins()
     yield
+    # Close pooled SQLite connections and log handles on shutdown
+    from backend.db.pool import close_all
+    from backend.runtime.context import close_loggers
+    close_all()
+    close_loggers()
 
 
 app = FastAPI(
     title="Visual Block Runtime API",
     description="Backend API for Visual Block Runtime Desktop Application",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS - allow all for local development
@@ -39,6 +46,7 @@ app.include_router(nodes.router, prefix="/api")
 app.include_router(variables.router, prefix="/api")
 app.include_router(execution.router, prefix="/api")
 app.include_router(logs.router, prefix="/api")
+app.include_router(events.router)
 
 
 @app.get("/")
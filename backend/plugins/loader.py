@@ -1,9 +1,13 @@
 """Plugin loader for discovering and loading plugins."""
 import importlib.util
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+log = logging.getLogger(__name__)
 
 
 class PluginLoader:
@@ -16,6 +20,8 @@ class PluginLoader:
         else:
             self.plugins_dir = Path(plugins_dir)
         self._plugins: Dict[str, Dict[str, Any]] = {}
+        # plugin_id -> (mtime_ns, size, plugin) of the last successful load
+        self._cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
     
     def discover_plugins(self) -> List[Dict]:
         """Discover and load all plugins from the plugins directory."""
@@ -24,23 +30,62 @@ class PluginLoader:
         if not self.plugins_dir.exists():
             return []
         
+        # Stat every plugin first; only new or changed files get loaded
+        found: List[Tuple[str, Path, os.stat_result]] = []
         for plugin_id in os.listdir(self.plugins_dir):
             plugin_path = self.plugins_dir / plugin_id
             plugin_file = plugin_path / "plugin.py"
             
-            if not plugin_file.exists():
-                continue
-            
             try:
-                plugin = self._load_plugin(plugin_id, plugin_file)
-                if plugin:
-                    self._plugins[plugin_id] = plugin
-            except Exception as e:
-                print(f"Error loading plugin {plugin_id}: {e}")
+                found.append((plugin_id, plugin_file, plugin_file.stat()))
+            except OSError:
+                # No plugin.py, or the entry is a file such as README.md
                 continue
         
+        loaded: Dict[str, Optional[Dict]] = {}
+        to_load = []
+        for plugin_id, plugin_file, st in found:
+            # Unchanged plugin.py: reuse the module and spec from last time
+            cached = self._cache.get(plugin_id)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                loaded[plugin_id] = cached[2]
+            else:
+                to_load.append((plugin_id, plugin_file))
+        
+        # Imports of heavy dependencies mostly wait on I/O and C extension
+        # init, so loading in threads overlaps them
+        if len(to_load) > 1:
+            workers = min(8, os.cpu_count() or 1, len(to_load))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    plugin_id: pool.submit(self._try_load_plugin, plugin_id, plugin_file)
+                    for plugin_id, plugin_file in to_load
+                }
+                for plugin_id, future in futures.items():
+                    loaded[plugin_id] = future.result()
+        else:
+            for plugin_id, plugin_file in to_load:
+                loaded[plugin_id] = self._try_load_plugin(plugin_id, plugin_file)
+        
+        # Keep directory order
+        for plugin_id, _, st in found:
+            plugin = loaded[plugin_id]
+            if plugin:
+                self._plugins[plugin_id] = plugin
+                self._cache[plugin_id] = (st.st_mtime_ns, st.st_size, plugin)
+            else:
+                self._cache.pop(plugin_id, None)
+        
         return list(self._plugins.values())
     
+    def _try_load_plugin(self, plugin_id: str, plugin_file: Path) -> Optional[Dict]:
+        """Load a plugin, logging instead of raising on failure."""
+        try:
+            return self._load_plugin(plugin_id, plugin_file)
+        except Exception as e:
+            log.error("Error loading plugin %s: %s", plugin_id, e)
+            return None
+    
     def _load_plugin(self, plugin_id: str, plugin_file: Path) -> Optional[Dict]:
         """Load a single plugin from its module."""
         spec = importlib.util.spec_from_file_location(plugin_id, plugin_file)
@@ -52,7 +97,7 @@ class PluginLoader:
         try:
             spec.loader.exec_module(module)
         except Exception as e:
-            print(f"Error executing module {plugin_id}: {e}")
+            log.error("Error executing module %s: %s", plugin_id, e)
             return None
         
         # Get spec and run functions
@@ -60,29 +105,29 @@ class PluginLoader:
         run = getattr(module, 'run', None)
         
         if get_spec is None:
-            print(f"Plugin {plugin_id} missing get_spec() function")
+            log.error("Plugin %s missing get_spec() function", plugin_id)
             return None
         
         try:
             spec_data = get_spec()
         except Exception as e:
-            print(f"Error calling get_spec() for {plugin_id}: {e}")
+            log.error("Error calling get_spec() for %s: %s", plugin_id, e)
             return None
         
         # Validate spec
         if not isinstance(spec_data, dict):
-            print(f"Plugin {plugin_id} get_spec() must return a dict")
+            log.error("Plugin %s get_spec() must return a dict", plugin_id)
             return None
         
         required_fields = ["plugin_id", "name", "version", "description", "category"]
         for field in required_fields:
             if field not in spec_data:
-                print(f"Plugin {plugin_id} spec missing required field: {field}")
+                log.error("Plugin %s spec missing required field: %s", plugin_id, field)
                 return None
         
         # Validate spec.plugin_id matches directory name
         if spec_data["plugin_id"] != plugin_id:
-            print(f"Plugin {plugin_id} spec.plugin_id mismatch")
+            log.error("Plugin %s spec.plugin_id mismatch", plugin_id)
             return None
         
         return {
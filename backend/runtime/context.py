@@ -1,15 +1,185 @@
 """Logging module for writing to log.txt."""
+import atexit
+import logging
 import os
-from datetime import datetime
-from typing import Optional
-import json
+import queue
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Union
+
+import orjson
+
+from .paths import paths_for
+
+log = logging.getLogger(__name__)
+
+# Log levels, numerically compatible with the logging module
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARN = logging.WARNING
+ERROR = logging.ERROR
+
+# Level -> name written to the lvl= field, and back
+_LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARN: "WARN", ERROR: "ERROR"}
+_LEVEL_VALUES = {name: level for level, name in _LEVEL_NAMES.items()}
+
+# One C-level pass to escape newlines in messages and node titles
+_ESCAPE_TABLE = str.maketrans({"\n": "\\n", "\r": "\\r"})
+
+
+def _dumps_details(details: dict) -> str:
+    """Compact UTF-8 JSON for the details field; unknown types are logged via str()."""
+    return orjson.dumps(details, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# (second, "YYYY-MM-DD HH:MM:SS") of the last formatted timestamp
+_ts_cache = (-1, "")
+
+
+def _timestamp() -> str:
+    """Local time as YYYY-MM-DD HH:MM:SS.mmm, formatting the seconds part once per second."""
+    global _ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1000):03d}"
+
+
+def _reverse_iter_lines(f, block: int = 65536):
+    """Yield (offset, line) for each line of a binary file, last line first."""
+    pos = f.seek(0, os.SEEK_END)
+    carry = b""
+    while pos > 0:
+        start = max(0, pos - block)
+        f.seek(start)
+        buf = f.read(pos - start) + carry
+        pos = start
+        idx = len(buf)
+        while True:
+            nl = buf.rfind(b"\n", 0, idx)
+            if nl == -1:
+                if start > 0:
+                    # Line continues into the previous block
+                    carry = buf[:idx]
+                else:
+                    yield 0, buf[:idx]
+                break
+            yield start + nl + 1, buf[nl + 1:idx]
+            idx = nl
+
+
+class _LogRecord(NamedTuple):
+    """A formatted line waiting for the writer thread."""
+    logger: "Logger"
+    line: str
+
+
+# Lines are formatted by the caller and written by one background thread,
+# in batches of up to _LOG_BATCH lines collected over at most
+# _LOG_BATCH_WINDOW seconds. When the queue is full new lines are dropped
+# and counted rather than blocking the caller (often the event loop).
+_LOG_BATCH = 256
+_LOG_BATCH_WINDOW = 0.010
+_LOG_Q: "queue.Queue[Optional[_LogRecord]]" = queue.Queue(maxsize=8192)
+# Seconds to wait for queued lines at interpreter exit
+_LOG_EXIT_TIMEOUT = 5.0
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _enqueue(record: _LogRecord) -> bool:
+    """Queue a line, starting the writer thread on first use. False if the queue is full."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_drain, name="log-writer", daemon=True)
+                _writer.start()
+    try:
+        _LOG_Q.put_nowait(record)
+    except queue.Full:
+        return False
+    return True
+
+
+def _drain():
+    """Writer thread: append queued lines in batches, one write per file."""
+    stopping = False
+    while not stopping:
+        batch = [_LOG_Q.get()]
+        deadline = time.monotonic() + _LOG_BATCH_WINDOW
+        while len(batch) < _LOG_BATCH and batch[-1] is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_LOG_Q.get(timeout=timeout))
+            except queue.Empty:
+                break
+        
+        # None is the shutdown sentinel; lines queued before it are written
+        if batch[-1] is None:
+            batch.pop()
+            stopping = True
+        
+        by_logger: Dict[Logger, List[str]] = {}
+        for record in batch:
+            by_logger.setdefault(record.logger, []).append(record.line)
+        for logger, lines in by_logger.items():
+            try:
+                logger._write_lines(lines)
+            except Exception as e:
+                log.warning("Cannot write to %s: %s", logger.log_path, e)
+            finally:
+                logger._mark_written(len(lines))
+            dropped = logger._take_dropped()
+            if dropped:
+                log.warning("Log queue full, dropped %d lines for %s", dropped, logger.log_path)
+
+
+def _stop_writer():
+    """Write out what is still queued, without hanging if the writer thread died."""
+    writer = _writer
+    if writer is None or not writer.is_alive():
+        return
+    try:
+        _LOG_Q.put(None, timeout=_LOG_EXIT_TIMEOUT)
+    except queue.Full:
+        return
+    writer.join(_LOG_EXIT_TIMEOUT)
+
+
+atexit.register(_stop_writer)
 
 
 class Logger:
     """Logger that writes to log.txt file."""
     
-    def __init__(self, log_path: str):
+    def __init__(self, log_path: str, flush_every: int = 1):
+        """
+        Args:
+            log_path: Path to log.txt
+            flush_every: Flush after this many lines; 1 flushes after
+                every batch the writer thread appends
+        """
         self.log_path = log_path
+        self.flush_every = flush_every
+        # Messages below this level are dropped before formatting
+        self.level = DEBUG
+        # Append handle, opened on first write and kept until close()
+        self._fh = None
+        self._unflushed = 0
+        self._lock = threading.Lock()
+        # Lines queued / handled by the writer thread; flush() waits for
+        # this logger's lines only, not for the shared queue to empty
+        self._queued = 0
+        self._written = 0
+        self._written_cv = threading.Condition()
+        # Lines dropped because the queue was full, reported by the writer
+        self._dropped = 0
         self._ensure_log_exists()
     
     def _ensure_log_exists(self):
@@ -21,62 +191,153 @@ class Logger:
     
     def _write(self, level: str, message: str, run_id: str = None, 
                node_uid: str = None, node_title: str = None, details: dict = None):
-        """Write a log line to file."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
+        """Format a log line and queue it for the writer thread."""
         # Format: YYYY-MM-DD HH:MM:SS.mmm | run=<run_id> | node=<node_uid> | title="<node_title>" | lvl=<LEVEL> | msg=<message>
-        
-        parts = [f"{timestamp}"]
-        
-        if run_id:
-            parts.append(f"run={run_id}")
-        else:
-            parts.append("run=-")
-        
-        if node_uid:
-            parts.append(f"node={node_uid}")
-        else:
-            parts.append("node=-")
-        
-        if node_title:
-            parts.append(f'title="{node_title}"')
-        else:
-            parts.append('title="-"')
-        
-        parts.append(f"lvl={level}")
-        
-        # Escape newlines in message
-        escaped_msg = message.replace('\n', '\\n').replace('\r', '\\r')
-        parts.append(f"msg={escaped_msg}")
-        
+        line = (
+            f'{_timestamp()} | run={run_id or "-"} | node={node_uid or "-"} | '
+            f'title="{node_title.translate(_ESCAPE_TABLE) if node_title else "-"}" | '
+            f'lvl={level} | msg={message.translate(_ESCAPE_TABLE)}'
+        )
         if details:
-            details_str = json.dumps(details)
-            parts.append(f"details={details_str}")
+            line += f" | details={_dumps_details(details)}"
+        line += "\n"
         
-        line = " | ".join(parts) + "\n"
-        
-        with open(self.log_path, 'a', encoding='utf-8') as f:
-            f.write(line)
+        with self._written_cv:
+            self._queued += 1
+        if not _enqueue(_LogRecord(self, line)):
+            with self._written_cv:
+                self._dropped += 1
+            self._mark_written(1)
+    
+    def _mark_written(self, count: int):
+        """Record that the writer thread handled count lines (writer thread)."""
+        with self._written_cv:
+            self._written += count
+            self._written_cv.notify_all()
     
-    def info(self, message: str, run_id: str = None, node_uid: str = None, 
+    def _take_dropped(self) -> int:
+        """Return and reset the dropped line count (writer thread)."""
+        with self._written_cv:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+    
+    def _wait_written(self):
+        """Block until every line queued before this call has been handled."""
+        with self._written_cv:
+            target = self._queued
+            self._written_cv.wait_for(lambda: self._written >= target)
+    
+    def _write_lines(self, lines: List[str]):
+        """Append formatted lines to the file (called by the writer thread)."""
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(
+                    self.log_path, 'a', encoding='utf-8',
+                    buffering=1 if self.flush_every <= 1 else -1
+                )
+            self._fh.write("".join(lines))
+            if self.flush_every > 1:
+                self._unflushed += len(lines)
+                if self._unflushed >= self.flush_every:
+                    self._fh.flush()
+                    self._unflushed = 0
+    
+    def flush(self):
+        """Write out queued and buffered lines."""
+        self._wait_written()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+                self._unflushed = 0
+    
+    def close(self):
+        """Flush and close the log file handle."""
+        self._wait_written()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+                self._unflushed = 0
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether a message at this level would be written."""
+        return level >= self.level
+    
+    def log(self, level: Union[int, str], message: str, *args, run_id: str = None,
+            node_uid: str = None, node_title: str = None, details: dict = None):
+        """Log a message at the given level (a level constant or its name)."""
+        if isinstance(level, str):
+            name, level = level, _LEVEL_VALUES.get(level, INFO)
+        else:
+            name = _LEVEL_NAMES.get(level, str(level))
+        if level >= self.level:
+            self._write(name, message % args if args else message,
+                        run_id, node_uid, node_title, details)
+    
+    def info(self, message: str, *args, run_id: str = None, node_uid: str = None,
              node_title: str = None, details: dict = None):
-        """Log INFO level message."""
-        self._write("INFO", message, run_id, node_uid, node_title, details)
+        """Log INFO level message; args are %-formatted into it only if written."""
+        if INFO >= self.level:
+            self._write("INFO", message % args if args else message,
+                        run_id, node_uid, node_title, details)
     
-    def debug(self, message: str, run_id: str = None, node_uid: str = None,
+    def debug(self, message: str, *args, run_id: str = None, node_uid: str = None,
               node_title: str = None, details: dict = None):
-        """Log DEBUG level message."""
-        self._write("DEBUG", message, run_id, node_uid, node_title, details)
+        """Log DEBUG level message; args are %-formatted into it only if written."""
+        if DEBUG >= self.level:
+            self._write("DEBUG", message % args if args else message,
+                        run_id, node_uid, node_title, details)
     
-    def warn(self, message: str, run_id: str = None, node_uid: str = None,
+    def warn(self, message: str, *args, run_id: str = None, node_uid: str = None,
              node_title: str = None, details: dict = None):
-        """Log WARN level message."""
-        self._write("WARN", message, run_id, node_uid, node_title, details)
+        """Log WARN level message; args are %-formatted into it only if written."""
+        if WARN >= self.level:
+            self._write("WARN", message % args if args else message,
+                        run_id, node_uid, node_title, details)
     
-    def error(self, message: str, run_id: str = None, node_uid: str = None,
+    def error(self, message: str, *args, run_id: str = None, node_uid: str = None,
               node_title: str = None, details: dict = None):
-        """Log ERROR level message."""
-        self._write("ERROR", message, run_id, node_uid, node_title, details)
+        """Log ERROR level message; args are %-formatted into it only if written."""
+        if ERROR >= self.level:
+            self._write("ERROR", message % args if args else message,
+                        run_id, node_uid, node_title, details)
+    
+    def _tail_offset(self, f, lines: int, marker: Optional[bytes]) -> int:
+        """Find the offset where the last N (matching) lines start."""
+        found = 0
+        for offset, line in _reverse_iter_lines(f):
+            if line and (marker is None or marker in line):
+                found += 1
+                if found == lines:
+                    return offset
+        return 0
+    
+    def iter_tail(self, lines: int = 100, filter_level: str = None):
+        """
+        Yield the last N lines from log file, oldest first.
+        
+        Only the offset of the first line is located up front; the lines
+        themselves are read and yielded one at a time.
+        """
+        if lines <= 0 or not os.path.exists(self.log_path):
+            return
+        
+        marker = f"| lvl={filter_level} |".encode() if filter_level else None
+        
+        self.flush()
+        with open(self.log_path, 'rb') as f:
+            f.seek(self._tail_offset(f, lines, marker))
+            remaining = lines
+            for raw in f:
+                if marker is not None and marker not in raw:
+                    continue
+                line = raw.decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+                yield line
+                remaining -= 1
+                if remaining == 0:
+                    break
     
     def tail(self, lines: int = 100, filter_level: str = None) -> list:
         """
@@ -88,20 +349,48 @@ class Logger:
         """
         if not os.path.exists(self.log_path):
             return []
+        if lines <= 0:
+            return []
+        self.flush()
         
-        with open(self.log_path, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
+        marker = f"| lvl={filter_level} |".encode() if filter_level else None
         
-        # Filter by level if specified
-        if filter_level:
-            filtered = []
-            for line in all_lines:
-                if f"lvl={filter_level}" in line or f"| lvl={filter_level}" in line:
-                    filtered.append(line.strip())
-            all_lines = filtered
+        # Walk lines from the end, stopping once enough have matched
+        chunks = []
+        with open(self.log_path, 'rb') as f:
+            for _, line in _reverse_iter_lines(f):
+                if line and (marker is None or marker in line):
+                    chunks.append(line)
+                    if len(chunks) == lines:
+                        break
         
-        # Return last N lines
-        return [line.strip() for line in all_lines[-lines:]]
+        return [
+            chunk.decode('utf-8', errors='replace').strip()
+            for chunk in reversed(chunks)
+        ]
+
+
+# Shared loggers by log path, so all writers of one file use one handle
+_loggers: Dict[str, Logger] = {}
+_loggers_lock = threading.Lock()
+
+
+def get_logger(log_path: str) -> Logger:
+    """Get the shared Logger for a log file."""
+    with _loggers_lock:
+        logger = _loggers.get(log_path)
+        if logger is None:
+            logger = _loggers[log_path] = Logger(log_path)
+        return logger
+
+
+def close_loggers():
+    """Close every shared logger (called on application shutdown)."""
+    with _loggers_lock:
+        loggers = list(_loggers.values())
+        _loggers.clear()
+    for logger in loggers:
+        logger.close()
 
 
 class RuntimeContext:
@@ -116,11 +405,17 @@ class RuntimeContext:
         self.project_dir = project_dir
         self.artifacts_dir = artifacts_dir
     
+    def reset(self, run_id: str, node_uid: str, node_title: str):
+        """Rebind the per-node fields so the context can be reused."""
+        self.run_id = run_id
+        self.node_uid = node_uid
+        self.node_title = node_title
+    
     def log(self, level: str, message: str, details: dict = None):
         """Log a message with context."""
-        self._logger._write(
-            level=level,
-            message=message,
+        self._logger.log(
+            level,
+            message,
             run_id=self.run_id,
             node_uid=self.node_uid,
             node_title=self.node_title,
@@ -156,7 +451,7 @@ class RuntimeContext:
     def artifacts_dir(self) -> str:
         """Get artifacts directory."""
         if self._artifacts_dir is None and self._project_dir:
-            return os.path.join(self._project_dir, "artifacts")
+            return str(paths_for(self._project_dir).artifacts)
         return self._artifacts_dir
     
     @artifacts_dir.setter
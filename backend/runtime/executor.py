@@ -1,11 +1,58 @@
 """Runtime executor for graph execution."""
 import asyncio
-import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any, Callable, Tuple
 from enum import Enum
+from types import MappingProxyType
 
-from .context import RuntimeContext, Logger
+from backend.db.database import AppDatabase, ProjectDatabase, loads_json
+from backend.db.pool import get_app_db, get_project_db
+from backend.plugins.loader import get_plugin_loader
+from .context import ERROR, INFO, WARN, RuntimeContext, get_logger
+
+# Plugin IDs of marker nodes that no plugin provides; they run as a
+# pass-through to their ok branch
+_PSEUDO_PLUGINS = frozenset({"__start__"})
+
+# Shared read-only fallbacks for nodes without outgoing edges
+_NO_EDGES = MappingProxyType({})
+_NO_TARGETS: Tuple[str, ...] = ()
+
+# Variable reads and writes run here, off the event loop. Two workers let
+# concurrent branches overlap DB waits without crowding out plugin threads.
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="executor-db")
+
+# Node result status -> log level of its "Node finished" line (else ERROR)
+_STATUS_TO_LEVEL = {"OK": INFO, "FAIL": WARN}
+_NODE_FINISHED = "Node finished: status="
+
+
+def _format_finish_message(status: str, code: Any) -> str:
+    """The "Node finished" log message for a status/code pair."""
+    return f"{_NODE_FINISHED}{status} code={code}" if code else _NODE_FINISHED + status
+
+
+_cached_finish_message = lru_cache(maxsize=256)(_format_finish_message)
+
+
+def _finish_message(status: str, code: Any) -> str:
+    """Memoized _format_finish_message; plugins may return unhashable codes."""
+    try:
+        return _cached_finish_message(status, code)
+    except TypeError:
+        return _format_finish_message(status, code)
+
+
+# Suffix that keeps run IDs unique when several start within one second
+_run_counter = itertools.count(1)
+
+
+def new_run_id() -> str:
+    """Generate a unique run ID: run_<YYYYmmdd_HHMMSS>_<n>."""
+    return f"run_{time.strftime('%Y%m%d_%H%M%S')}_{next(_run_counter)}"
 
 
 class ExecutionState(Enum):
@@ -18,13 +65,31 @@ class ExecutionState(Enum):
     ERROR = "Error"
 
 
+class PreparedGraph(NamedTuple):
+    """Lookup tables and static analysis of a graph, built once per run."""
+    nodes_dict: Dict[str, Dict]
+    edges_by_node: Dict[str, Dict[str, List[str]]]
+    start_uid: Optional[str]
+    # Nodes on or between cycles; empty for an acyclic graph
+    cyclic: List[str]
+
+
 class GraphExecutor:
     """Executes the graph based on nodes and edges."""
     
+    __slots__ = (
+        "project_dir", "log_path", "logger", "event_callback",
+        "state", "current_run_id", "active_node_uid", "active_node_title",
+        "_stop_requested", "_hard_stop_requested", "_should_pause",
+        "_loop", "_resume_event", "_plugin_cache", "_proj_db", "_app_db",
+        "_var_getters", "_var_setters", "_var_cache",
+        "_ctx_pool",
+    )
+    
     def __init__(self, project_dir: str, log_path: str, event_callback: Callable = None):
         self.project_dir = project_dir
         self.log_path = log_path
-        self.logger = Logger(log_path)
+        self.logger = get_logger(log_path)
         self.event_callback = event_callback or (lambda x: None)
         
         self.state = ExecutionState.IDLE
@@ -35,9 +100,30 @@ class GraphExecutor:
         self._stop_requested = False
         self._hard_stop_requested = False
         self._should_pause = False
+        # Set to wake a paused run; bound to the run's loop in execute()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._resume_event: Optional[asyncio.Event] = None
+        # plugin_id -> loaded plugin (or None), filled on first use per run
+        self._plugin_cache: Dict[str, Optional[Dict]] = {}
+        # Shared DB handles, resolved on first variable access in a run
+        self._proj_db: Optional[ProjectDatabase] = None
+        self._app_db: Optional[AppDatabase] = None
+        # Variable ref scope -> accessor
+        self._var_getters: Dict[str, Callable[[int], Optional[Dict]]] = {
+            "proj": self._proj_db_get,
+            "glob": self._app_db_get,
+        }
+        self._var_setters: Dict[str, Callable[[int, Any], Optional[str]]] = {
+            "proj": self._proj_db_set,
+            "glob": self._app_db_set,
+        }
+        # (scope, var_id) -> stored JSON, valid for the current run only
+        self._var_cache: Dict[Tuple[str, int], str] = {}
+        # Contexts handed to plugins are recycled between nodes
+        self._ctx_pool: List[RuntimeContext] = []
     
     async def execute(self, graph: Dict, start_node_id: str = None, 
-                      from_beginning: bool = False) -> Dict:
+                      from_beginning: bool = False, run_id: str = None) -> Dict:
         """
         Execute the graph starting from a node.
         
@@ -45,6 +131,7 @@ class GraphExecutor:
             graph: Graph data with nodes and edges
             start_node_id: Node UID to start from (if not from_beginning)
             from_beginning: If True, start from __start__ node
+            run_id: Run ID to log under (generated if not given)
         
         Returns:
             Execution result
@@ -52,32 +139,29 @@ class GraphExecutor:
         self._stop_requested = False
         self._hard_stop_requested = False
         self._should_pause = False
+        self._loop = asyncio.get_running_loop()
+        self._resume_event = asyncio.Event()
+        # Plugins may have been reloaded since the last run
+        self.invalidate_plugin_cache()
+        self._var_cache.clear()
         self.state = ExecutionState.RUNNING
         
         # Generate run_id
-        run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        run_id = run_id or new_run_id()
         self.current_run_id = run_id
         
-        self.logger.info(f"Execution started (from_beginning={from_beginning})", run_id=run_id)
+        self.logger.info("Execution started (from_beginning=%s)", from_beginning, run_id=run_id)
         self._emit_state()
         
         try:
-            # Build adjacency list from edges
-            edges = graph.get("edges", [])
-            edges_by_node = self._build_edge_map(edges)
-            
-            # Get nodes
-            nodes = graph.get("nodes", [])
-            nodes_dict = {n["id"]: n for n in nodes}
+            prepared = self.prepare(graph)
+            nodes_dict = prepared.nodes_dict
+            edges_by_node = prepared.edges_by_node
             
             # Find start node
             start_uid = None
             if from_beginning:
-                # Find __start__ node
-                for node in nodes:
-                    if node.get("data", {}).get("plugin_id") == "__start__":
-                        start_uid = node["id"]
-                        break
+                start_uid = prepared.start_uid
                 if not start_uid:
                     return {"success": False, "error": "No Start node found"}
             elif start_node_id:
@@ -85,10 +169,13 @@ class GraphExecutor:
             else:
                 return {"success": False, "error": "No start node specified"}
             
-            # Start traversal from start node
-            result = await self._execute_node(
-                start_uid, nodes_dict, edges_by_node, run_id
-            )
+            cyclic = self._warn_graph_issues(prepared, start_uid, run_id)
+            
+            if cyclic:
+                # Join points cannot be counted when a node may run again
+                result = await self._run_sequential(start_uid, nodes_dict, edges_by_node, run_id)
+            else:
+                result = await self._run_concurrent(start_uid, prepared, run_id)
             
             if self._hard_stop_requested:
                 self.state = ExecutionState.STOPPED
@@ -101,54 +188,248 @@ class GraphExecutor:
             
         except Exception as e:
             self.state = ExecutionState.ERROR
-            self.logger.error(f"Execution error: {str(e)}", run_id=run_id)
+            self.logger.error("Execution error: %s", e, run_id=run_id)
             return {"success": False, "error": str(e)}
         finally:
             self._emit_state()
             self.current_run_id = None
             self.active_node_uid = None
+            self._proj_db = None
+            self._app_db = None
+            self._var_cache.clear()
+    
+    def prepare(self, graph: Dict) -> PreparedGraph:
+        """Build the lookup tables for a graph and analyse it."""
+        nodes = graph.get("nodes", [])
+        edges_by_node = self._build_edge_map(graph.get("edges", []))
+        nodes_dict = {n["id"]: n for n in nodes}
+        
+        start_uid = None
+        for node in nodes:
+            if node.get("data", {}).get("plugin_id") == "__start__":
+                start_uid = node["id"]
+                break
+        
+        return PreparedGraph(
+            nodes_dict=nodes_dict,
+            edges_by_node=edges_by_node,
+            start_uid=start_uid,
+            cyclic=self._find_cyclic(nodes_dict, edges_by_node)
+        )
+    
+    @staticmethod
+    def _find_cyclic(nodes_dict: Dict, edges_by_node: Dict) -> List[str]:
+        """Return the nodes on (or between) cycles, using Kahn's algorithm."""
+        succ = {
+            uid: [t for t in GraphExecutor._successors(uid, edges_by_node) if t in nodes_dict]
+            for uid in nodes_dict
+        }
+        in_degree = dict.fromkeys(nodes_dict, 0)
+        for targets in succ.values():
+            for t in targets:
+                in_degree[t] += 1
+        
+        # Peel off nodes with no incoming edges; what remains feeds a cycle
+        ready = [uid for uid, deg in in_degree.items() if deg == 0]
+        while ready:
+            uid = ready.pop()
+            del in_degree[uid]
+            for t in succ[uid]:
+                in_degree[t] -= 1
+                if in_degree[t] == 0:
+                    ready.append(t)
+        remaining = set(in_degree)
+        
+        # Then drop the nodes that only lead out of the cycles
+        changed = True
+        while changed:
+            changed = False
+            for uid in list(remaining):
+                if not any(t in remaining for t in succ[uid]):
+                    remaining.discard(uid)
+                    changed = True
+        return sorted(remaining)
+    
+    def _warn_graph_issues(self, prepared: PreparedGraph, start_uid: str, run_id: str) -> List[str]:
+        """Log problems found by prepare() before any node runs; return the cycle nodes the run can reach."""
+        reachable = self._reachable(start_uid, prepared)
+        # Checked per run: the plugin set can change between runs
+        missing = {}
+        for uid, node in prepared.nodes_dict.items():
+            plugin_id = node.get("data", {}).get("plugin_id")
+            if (uid in reachable and plugin_id not in _PSEUDO_PLUGINS
+                    and self._get_plugin(plugin_id) is None):
+                missing[uid] = plugin_id
+        if missing:
+            self.logger.warn(
+                "Plugins not found: %s", ", ".join(f"{uid}={pid}" for uid, pid in missing.items()),
+                run_id=run_id
+            )
+        cyclic = [uid for uid in prepared.cyclic if uid in reachable]
+        if cyclic:
+            self.logger.warn("Graph has a cycle through: %s", ", ".join(cyclic), run_id=run_id)
+        unreachable = len(prepared.nodes_dict.keys() - reachable)
+        if unreachable:
+            self.logger.debug("%d node(s) not reachable from %s", unreachable, start_uid, run_id=run_id)
+        return cyclic
+    
+    @staticmethod
+    def _reachable(start_uid: str, prepared: PreparedGraph) -> set:
+        """UIDs reachable from start_uid through any branch (dangling targets included)."""
+        reachable = set()
+        stack = [start_uid]
+        while stack:
+            uid = stack.pop()
+            if uid in reachable:
+                continue
+            reachable.add(uid)
+            stack.extend(GraphExecutor._successors(uid, prepared.edges_by_node))
+        return reachable
+    
+    async def _run_sequential(self, start_uid: str, nodes_dict: Dict,
+                              edges_by_node: Dict, run_id: str) -> Optional[Dict]:
+        """Walk the graph one node at a time, following the first target of each branch."""
+        result = None
+        node_uid = start_uid
+        while node_uid:
+            result, next_uids = await self._execute_node(
+                node_uid, nodes_dict, edges_by_node, run_id
+            )
+            node_uid = next_uids[0] if next_uids else None
+        return result
+    
+    async def _run_concurrent(self, start_uid: str, prepared: PreparedGraph,
+                              run_id: str) -> Optional[Dict]:
+        """
+        Run an acyclic graph in dependency order, dispatching ready nodes concurrently.
+        
+        This is Kahn's algorithm driven by completions: each node waits until
+        every reachable predecessor has either taken the edge to it or
+        finished without it. It runs if at least one took the edge and is
+        skipped (along with its successors) otherwise.
+        """
+        nodes_dict = prepared.nodes_dict
+        edges_by_node = prepared.edges_by_node
+        
+        # Predecessors still to be heard from, per node
+        pending = self._in_degree(start_uid, prepared)
+        arrived = set()
+        # Results of nodes that ended a branch, in completion order
+        ends: List[Dict] = []
+        
+        def settle(uid: str, taken: List[str]) -> List[str]:
+            """Signal uid's successors and return those now ready to run."""
+            ready = []
+            stack = [(uid, taken)]
+            while stack:
+                uid, taken = stack.pop()
+                for target in self._successors(uid, edges_by_node):
+                    if target in taken:
+                        arrived.add(target)
+                    pending[target] -= 1
+                    if pending[target] == 0:
+                        if target in arrived:
+                            ready.append(target)
+                        else:
+                            # No predecessor chose it: skip it and its subtree
+                            stack.append((target, _NO_TARGETS))
+            return ready
+        
+        def complete(uid: str, result: Dict, next_uids: List[str]):
+            if not next_uids:
+                ends.append(result)
+            ready.extend(settle(uid, next_uids))
+        
+        ready = [start_uid]
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while ready or running:
+                if len(ready) == 1 and not running:
+                    # Nothing to overlap with: run it inline, no task needed
+                    uid = ready.pop()
+                    complete(uid, *await self._execute_node(uid, nodes_dict, edges_by_node, run_id))
+                    continue
+                for uid in ready:
+                    task = asyncio.ensure_future(
+                        self._execute_node(uid, nodes_dict, edges_by_node, run_id)
+                    )
+                    running[task] = uid
+                ready.clear()
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    complete(running.pop(task), *task.result())
+        finally:
+            # Only reached with tasks left if one of them raised
+            for task in running:
+                task.cancel()
+        
+        # OK only if every branch ended OK; otherwise report the first that did not
+        for result in ends:
+            if result.get("status") != "OK":
+                return result
+        return ends[-1] if ends else None
+    
+    def _in_degree(self, start_uid: str, prepared: PreparedGraph) -> Dict[str, int]:
+        """Reachable predecessor count per node for a run from start_uid."""
+        reachable = self._reachable(start_uid, prepared)
+        counts = dict.fromkeys(reachable, 0)
+        for uid in reachable:
+            for target in self._successors(uid, prepared.edges_by_node):
+                counts[target] += 1
+        return counts
     
     async def _execute_node(self, node_uid: str, nodes_dict: Dict, 
-                           edges_by_node: Dict, run_id: str) -> Dict:
-        """Execute a single node."""
+                           edges_by_node: Dict, run_id: str) -> Tuple[Dict, List[str]]:
+        """Execute a single node and return its result and the next node UIDs."""
         
         # Check for hard stop
         if self._hard_stop_requested:
-            return {"status": "STOPPED", "code": "HARD_STOP"}
+            return {"status": "STOPPED", "code": "HARD_STOP"}, _NO_TARGETS
         
         # Check for soft stop (after current node completes)
         if self._stop_requested:
-            return {"status": "STOPPED", "code": "SOFT_STOP"}
+            return {"status": "STOPPED", "code": "SOFT_STOP"}, _NO_TARGETS
         
         node = nodes_dict.get(node_uid)
         if not node:
-            return {"status": "ERROR", "code": "NODE_NOT_FOUND", "node_uid": node_uid}
+            return {"status": "ERROR", "code": "NODE_NOT_FOUND", "node_uid": node_uid}, _NO_TARGETS
         
         node_data = node.get("data", {})
         plugin_id = node_data.get("plugin_id")
         node_title = node_data.get("node_title", plugin_id)
+        params = node_data.get("params", {})
+        input_var_ref = node_data.get("input_var_ref")
+        output_var_ref = node_data.get("output_var_ref")
+        breakpoint_set = node_data.get("breakpoint")
+        error_to_fail = node_data.get("error_to_fail")
         
         self.active_node_uid = node_uid
         self.active_node_title = node_title
-        self._emit_state()
         
-        self.logger.info(f"Node started: {node_title}", run_id=run_id, 
+        self.logger.info("Node started: %s", node_title, run_id=run_id, 
                         node_uid=node_uid, node_title=node_title)
-        self._emit_node_status(node_uid, "running")
+        self._emit_combined(True, node_uid, "running")
         
         # Check for breakpoint (pause before execution)
-        if node_data.get("breakpoint"):
+        if breakpoint_set:
+            self._resume_event.clear()
             self.state = ExecutionState.PAUSED
             self.logger.info("Paused at breakpoint", run_id=run_id,
                            node_uid=node_uid, node_title=node_title)
             self._emit_state()
             
-            # Wait until unpaused or stopped
-            while self.state == ExecutionState.PAUSED and not self._hard_stop_requested:
-                await asyncio.sleep(0.1)
+            # Wait until resume() or hard_stop() sets the event
+            if not self._hard_stop_requested:
+                await self._resume_event.wait()
             
             if self._hard_stop_requested:
-                return {"status": "STOPPED", "code": "HARD_STOP"}
+                return {"status": "STOPPED", "code": "HARD_STOP"}, _NO_TARGETS
+        
+        # Marker nodes such as __start__ have no plugin; they just pass on
+        if plugin_id in _PSEUDO_PLUGINS:
+            result = {"status": "OK"}
+            self._finish_node(node_uid, node_title, run_id, result)
+            return result, self._get_next_nodes(node_uid, "ok", edges_by_node)
         
         # Get plugin
         plugin = self._get_plugin(plugin_id)
@@ -156,50 +437,43 @@ class GraphExecutor:
             result = {"status": "ERROR", "code": "PLUGIN_NOT_FOUND", 
                      "message": f"Plugin {plugin_id} not found"}
             self._finish_node(node_uid, node_title, run_id, result)
-            return result
-        
-        # Get parameters and variables
-        params = node_data.get("params", {})
-        input_var_ref = node_data.get("input_var_ref")
-        output_var_ref = node_data.get("output_var_ref")
+            return result, _NO_TARGETS
         
         # Validate input requirement
         if plugin.get("requires_input") and not input_var_ref:
             result = {"status": "ERROR", "code": "INPUT.NOT_SELECTED",
                      "message": "Input variable not selected"}
             self._finish_node(node_uid, node_title, run_id, result)
-            return result
+            return result, _NO_TARGETS
         
         # Validate output requirement
         if plugin.get("produces_output") and not output_var_ref:
             result = {"status": "ERROR", "code": "OUTPUT.NOT_SELECTED",
                      "message": "Output variable not selected"}
             self._finish_node(node_uid, node_title, run_id, result)
-            return result
+            return result, _NO_TARGETS
         
         # Get input data
         in_data = None
         if input_var_ref:
-            in_data = self._get_variable_value(input_var_ref)
+            in_data = await self._get_variable_value(input_var_ref)
         
         # Execute plugin
-        ctx = RuntimeContext(
-            run_id=run_id,
-            node_uid=node_uid,
-            node_title=node_title,
-            logger=self.logger,
-            project_dir=self.project_dir
-        )
-        
+        ctx = self._acquire_ctx(run_id, node_uid, node_title)
         try:
             if plugin.get("run_func"):
-                run_result = plugin["run_func"](ctx, params, in_data)
+                # Plugin code is blocking; keep it off the event loop
+                run_result = await asyncio.to_thread(
+                    plugin["run_func"], ctx, params, in_data
+                )
             else:
                 run_result = {"status": "ERROR", "code": "NO_RUN_FUNC",
                              "message": "Plugin has no run function"}
         except Exception as e:
             run_result = {"status": "ERROR", "code": "PLUGIN_EXCEPTION",
                          "message": str(e), "details": {"exception": str(type(e).__name__)}}
+        finally:
+            self._release_ctx(ctx)
         
         # Handle result
         if not isinstance(run_result, dict):
@@ -209,120 +483,199 @@ class GraphExecutor:
         # Save output if OK
         if run_result.get("status") == "OK" and output_var_ref:
             output = run_result.get("output")
-            self._set_variable_value(output_var_ref, output)
+            await self._set_variable_value(output_var_ref, output)
         
         # Determine next node
         status = run_result.get("status", "ERROR")
         
+        next_uids = _NO_TARGETS
         if status == "OK":
-            next_uid = self._get_next_node(node_uid, "ok", edges_by_node)
-            if next_uid:
-                return await self._execute_node(next_uid, nodes_dict, edges_by_node, run_id)
+            next_uids = self._get_next_nodes(node_uid, "ok", edges_by_node)
         elif status == "FAIL":
-            next_uid = self._get_next_node(node_uid, "fail", edges_by_node)
-            if next_uid:
-                return await self._execute_node(next_uid, nodes_dict, edges_by_node, run_id)
-        elif status == "ERROR":
-            if node_data.get("error_to_fail"):
-                next_uid = self._get_next_node(node_uid, "fail", edges_by_node)
-                if next_uid:
-                    return await self._execute_node(next_uid, nodes_dict, edges_by_node, run_id)
-            # else: stop execution
+            next_uids = self._get_next_nodes(node_uid, "fail", edges_by_node)
+        elif status == "ERROR" and error_to_fail:
+            next_uids = self._get_next_nodes(node_uid, "fail", edges_by_node)
+        # else: stop execution
         
         self._finish_node(node_uid, node_title, run_id, run_result)
-        return run_result
+        return run_result, next_uids
     
     def _finish_node(self, node_uid: str, node_title: str, run_id: str, result: Dict):
         """Finish node execution and log result."""
         status = result.get("status", "ERROR")
         code = result.get("code", "")
         
-        log_level = "INFO" if status == "OK" else ("WARN" if status == "FAIL" else "ERROR")
-        message = f"Node finished: status={status}" + (f" code={code}" if code else "")
-        
-        self.logger.log(log_level, message, run_id=run_id, 
-                       node_uid=node_uid, node_title=node_title)
+        level = _STATUS_TO_LEVEL.get(status, ERROR)
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, _finish_message(status, code), run_id=run_id,
+                            node_uid=node_uid, node_title=node_title)
         self._emit_node_status(node_uid, status.lower())
         
-        self.active_node_uid = None
-        self.active_node_title = None
+        # Another branch may have started a node since this one did
+        if self.active_node_uid == node_uid:
+            self.active_node_uid = None
+            self.active_node_title = None
     
-    def _build_edge_map(self, edges: List[Dict]) -> Dict[str, List[Dict]]:
-        """Build adjacency list from edges."""
+    def _acquire_ctx(self, run_id: str, node_uid: str, node_title: str) -> RuntimeContext:
+        """Take a context from the pool (or create one) bound to a node."""
+        if self._ctx_pool:
+            ctx = self._ctx_pool.pop()
+            ctx.reset(run_id, node_uid, node_title)
+            return ctx
+        return RuntimeContext(
+            run_id=run_id,
+            node_uid=node_uid,
+            node_title=node_title,
+            logger=self.logger,
+            project_dir=self.project_dir
+        )
+    
+    def _release_ctx(self, ctx: RuntimeContext):
+        """Return a context to the pool once its node has finished."""
+        ctx.reset(None, None, None)
+        self._ctx_pool.append(ctx)
+    
+    def _build_edge_map(self, edges: List[Dict]) -> Dict[str, Dict[str, List[str]]]:
+        """Build a source -> {branch: [targets]} table from edges."""
         result = {}
         for edge in edges:
-            source = edge.get("source")
-            if source not in result:
-                result[source] = []
-            result[source].append({
-                "target": edge.get("target"),
-                "branch": edge.get("data", {}).get("branch", "ok")
-            })
+            branch = edge.get("data", {}).get("branch", "ok")
+            targets = result.setdefault(edge.get("source"), {}).setdefault(branch, [])
+            if edge.get("target") not in targets:
+                targets.append(edge.get("target"))
         return result
     
-    def _get_next_node(self, node_uid: str, branch: str, edges_by_node: Dict) -> Optional[str]:
-        """Get the next node based on branch."""
-        edges = edges_by_node.get(node_uid, [])
-        for edge in edges:
-            if edge.get("branch") == branch:
-                return edge.get("target")
-        return None
+    def _get_next_nodes(self, node_uid: str, branch: str, edges_by_node: Dict) -> List[str]:
+        """Get the next nodes based on branch, in edge order."""
+        return edges_by_node.get(node_uid, _NO_EDGES).get(branch, _NO_TARGETS)
+    
+    @staticmethod
+    def _successors(node_uid: str, edges_by_node: Dict) -> List[str]:
+        """All distinct targets of a node, across branches."""
+        branches = edges_by_node.get(node_uid, _NO_EDGES)
+        if len(branches) == 1:
+            return next(iter(branches.values()))
+        return list(dict.fromkeys(t for targets in branches.values() for t in targets))
     
     def _get_plugin(self, plugin_id: str) -> Optional[Dict]:
         """Get a loaded plugin by ID."""
-        from backend.plugins.loader import get_plugin_loader
-        return get_plugin_loader().get_plugin(plugin_id)
+        try:
+            return self._plugin_cache[plugin_id]
+        except KeyError:
+            plugin = self._plugin_cache[plugin_id] = get_plugin_loader().get_plugin(plugin_id)
+            return plugin
     
-    def _get_variable_value(self, ref: str) -> Any:
-        """Get variable value by ref."""
-        from backend.db.database import ProjectDatabase, AppDatabase
-        
+    def invalidate_plugin_cache(self):
+        """Forget resolved plugins so the next lookup sees the loader's current set."""
+        self._plugin_cache.clear()
+    
+    def _project_db(self) -> ProjectDatabase:
+        """Project database handle for the current run, looked up once."""
+        if self._proj_db is None:
+            self._proj_db = get_project_db(self.project_dir)
+        return self._proj_db
+    
+    def _global_db(self) -> AppDatabase:
+        """App (global variables) database handle for the current run, looked up once."""
+        if self._app_db is None:
+            self._app_db = get_app_db(self.project_dir)
+        return self._app_db
+    
+    def _proj_db_get(self, var_id: int) -> Optional[Dict]:
+        """Read a project variable row."""
+        return self._project_db().get_project_var(var_id)
+    
+    def _app_db_get(self, var_id: int) -> Optional[Dict]:
+        """Read a global variable row."""
+        return self._global_db().get_global_var(var_id)
+    
+    def _proj_db_set(self, var_id: int, value: Any) -> Optional[str]:
+        """Write a project variable value."""
+        return self._project_db().set_project_var_value(var_id, value)
+    
+    def _app_db_set(self, var_id: int, value: Any) -> Optional[str]:
+        """Write a global variable value."""
+        return self._global_db().set_global_var_value(var_id, value)
+    
+    async def _get_variable_value(self, ref: str) -> Any:
+        """Get variable value by ref ("<scope>:<var_id>")."""
+        scope, _, var_id = ref.partition(":")
+        getter = self._var_getters.get(scope)
+        if getter is None:
+            return None
         try:
-            if ref.startswith("proj:"):
-                var_id = int(ref[5:])
-                db = ProjectDatabase(f"{self.project_dir}/project.sqlite")
-                var = db.get_project_var(var_id)
-                if var:
-                    return json.loads(var.get("value_json", "null"))
-            elif ref.startswith("glob:"):
-                var_id = int(ref[5:])
-                db = AppDatabase(f"{self.project_dir}/../app.sqlite")
-                var = db.get_global_var(var_id)
-                if var:
-                    return json.loads(var.get("value_json", "null"))
+            key = (scope, int(var_id))
+            value_json = self._var_cache.get(key)
+            if value_json is None:
+                var = await self._loop.run_in_executor(_DB_EXECUTOR, getter, key[1])
+                if not var:
+                    return None
+                value_json = self._var_cache[key] = var.get("value_json", "null")
+            # Decode per read so each node gets its own copy
+            return loads_json(value_json)
         except Exception:
             pass
         return None
     
-    def _set_variable_value(self, ref: str, value: Any):
-        """Set variable value by ref."""
-        from backend.db.database import ProjectDatabase, AppDatabase
-        
+    async def _set_variable_value(self, ref: str, value: Any):
+        """Set variable value by ref ("<scope>:<var_id>")."""
+        scope, _, var_id = ref.partition(":")
+        setter = self._var_setters.get(scope)
+        if setter is None:
+            return
+        key = None
+        try:
+            key = (scope, int(var_id))
+            value_json = await self._loop.run_in_executor(
+                _DB_EXECUTOR, setter, key[1], value
+            )
+            if value_json is None:
+                # No row was updated: don't cache a value the DB doesn't hold
+                self._var_cache.pop(key, None)
+                self.logger.warn("Variable %s does not exist", ref)
+            else:
+                self._var_cache[key] = value_json
+        except Exception as e:
+            self._var_cache.pop(key, None)
+            self.logger.error("Failed to set variable %s: %s", ref, e)
+    
+    def _emit(self, event: Dict):
+        """Hand an event to event_callback, which does any coalescing."""
         try:
-            if ref.startswith("proj:"):
-                var_id = int(ref[5:])
-                db = ProjectDatabase(f"{self.project_dir}/project.sqlite")
-                db.set_project_var_value(var_id, value)
-            elif ref.startswith("glob:"):
-                var_id = int(ref[5:])
-                db = AppDatabase(f"{self.project_dir}/../app.sqlite")
-                db.set_global_var_value(var_id, value)
+            self.event_callback(event)
         except Exception as e:
-            self.logger.error(f"Failed to set variable {ref}: {e}")
+            self.logger.error("Event callback failed: %s", e)
     
-    def _emit_state(self):
-        """Emit state change event."""
-        self.event_callback({
+    def _state_event(self) -> Dict:
+        """Build a run_state event from the current state."""
+        return {
             "type": "run_state",
             "state": self.state.value,
             "run_id": self.current_run_id,
             "active_node_uid": self.active_node_uid,
             "active_node_title": self.active_node_title
-        })
+        }
+    
+    def _emit_state(self):
+        """Emit state change event."""
+        self._emit(self._state_event())
+    
+    def _emit_combined(self, state_changed: bool, node_uid: str = None,
+                       node_status: Optional[str] = None):
+        """Emit a state change and a node status change as one run_state event."""
+        if not state_changed:
+            if node_status is not None:
+                self._emit_node_status(node_uid, node_status)
+            return
+        event = self._state_event()
+        if node_status is not None:
+            event["node_uid"] = node_uid
+            event["node_status"] = node_status
+        self._emit(event)
     
     def _emit_node_status(self, node_uid: str, status: str):
         """Emit node status change event."""
-        self.event_callback({
+        self._emit({
             "type": "node_status",
             "node_uid": node_uid,
             "status": status
@@ -335,9 +688,30 @@ class GraphExecutor:
     def hard_stop(self):
         """Request hard stop."""
         self._hard_stop_requested = True
+        self._wake()
     
     def resume(self):
         """Resume from pause."""
         if self.state == ExecutionState.PAUSED:
             self.state = ExecutionState.RUNNING
             self._emit_state()
+            self._wake()
+    
+    def _wake(self):
+        """Wake a paused run; safe to call from any thread."""
+        if self._resume_event is not None:
+            self._call_on_loop(self._resume_event.set)
+    
+    def _call_on_loop(self, func: Callable, *args):
+        """Run func on the run's event loop, directly if already on it."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            func(*args)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(func, *args)
@@ -0,0 +1,26 @@
+"""Filesystem layout of a project directory."""
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+
+class ProjectPaths(NamedTuple):
+    """Resolved locations of the files that belong to a project."""
+    root: Path
+    db: Path
+    app_db: Path
+    log: Path
+    artifacts: Path
+
+
+@lru_cache(maxsize=128)
+def paths_for(root: str) -> ProjectPaths:
+    """Resolve the layout of a project directory (cached per root string)."""
+    p = Path(root).resolve()
+    return ProjectPaths(
+        root=p,
+        db=p / "project.sqlite",
+        app_db=p.parent / "app.sqlite",
+        log=p / "log.txt",
+        artifacts=p / "artifacts"
+    )
@@ -321,9 +321,15 @@ export const useStore = create((set, get) => ({
     
     try {
       const res = await axios.get(`${API_BASE}/log/tail`, {
-        params: { path: projectPath, lines: 500 }
+        params: { path: projectPath, lines: 500 },
+        responseType: 'text'
       })
-      set({ logLines: res.data.lines })
+      // NDJSON: one JSON-encoded log line per row
+      const logLines = res.data
+        .split('\n')
+        .filter(row => row)
+        .map(row => JSON.parse(row))
+      set({ logLines })
     } catch (error) {
       console.error('Failed to load log:', error)
     }
@@ -1,56 +1,60 @@
 """Example Plugin for Visual Block Runtime."""
 
 
+# Спецификация собирается один раз при импорте и не должна изменяться
+_SPEC = {
+    "plugin_id": "example_plugin",
+    "name": "Example Plugin",
+    "version": "1.0.0",
+    "description": "Пример плагина для демонстрации структуры плагинов.",
+    "category": "Utility",
+    "tags": ["example", "demo", "test"],
+    "requires_input": False,
+    "produces_output": True,
+    "params": [
+        {
+            "key": "message",
+            "label": "Message",
+            "type": "string",
+            "default": "Hello World",
+            "help": "Message that will be logged and returned as output.",
+            "group": "Main",
+            "advanced": False,
+            "ui_visibility": "inspector",
+            "node_order": 0,
+            "node_compact": False,
+        },
+        {
+            "key": "count",
+            "label": "Count",
+            "type": "int",
+            "default": 1,
+            "help": "Number of times to repeat the message.",
+            "group": "Main",
+            "advanced": False,
+            "ui_visibility": "inspector",
+            "node_order": 1,
+            "node_compact": False,
+        },
+        {
+            "key": "fail_simulation",
+            "label": "Simulate Failure",
+            "type": "bool",
+            "default": False,
+            "help": "If true, the plugin will return FAIL status.",
+            "group": "Debug",
+            "advanced": True,
+            "ui_visibility": "inspector",
+            "node_order": 2,
+            "node_compact": False,
+        },
+    ]
+}
+
+
 def get_spec():
     """Возвращает спецификацию плагина."""
-    return {
-        "plugin_id": "example_plugin",
-        "name": "Example Plugin",
-        "version": "1.0.0",
-        "description": "Пример плагина для демонстрации структуры плагинов.",
-        "category": "Utility",
-        "tags": ["example", "demo", "test"],
-        "requires_input": False,
-        "produces_output": True,
-        "params": [
-            {
-                "key": "message",
-                "label": "Message",
-                "type": "string",
-                "default": "Hello World",
-                "help": "Message that will be logged and returned as output.",
-                "group": "Main",
-                "advanced": False,
-                "ui_visibility": "inspector",
-                "node_order": 0,
-                "node_compact": False,
-            },
-            {
-                "key": "count",
-                "label": "Count",
-                "type": "int",
-                "default": 1,
-                "help": "Number of times to repeat the message.",
-                "group": "Main",
-                "advanced": False,
-                "ui_visibility": "inspector",
-                "node_order": 1,
-                "node_compact": False,
-            },
-            {
-                "key": "fail_simulation",
-                "label": "Simulate Failure",
-                "type": "bool",
-                "default": False,
-                "help": "If true, the plugin will return FAIL status.",
-                "group": "Debug",
-                "advanced": True,
-                "ui_visibility": "inspector",
-                "node_order": 2,
-                "node_compact": False,
-            },
-        ]
-    }
+    return _SPEC
 
 
 def run(ctx, params, in_data):
@@ -82,7 +86,7 @@ def run(ctx, params, in_data):
         }
     
     # Формируем вывод
-    result_message = " ".join([message] * count)
+    result_message = message if count == 1 else " ".join([message] * count)
     
     ctx.log("INFO", f"Example plugin finished successfully")
     
@@ -0,0 +1,33 @@
+"""Tests for the runtime logger."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from backend.runtime import context
+from backend.runtime.context import Logger
+
+
+class LoggerQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.logger = Logger(os.path.join(self._dir.name, "log.txt"))
+        self.addCleanup(self.logger.close)
+
+    def test_full_queue_drops_line_without_blocking_flush(self):
+        with mock.patch.object(context, "_enqueue", return_value=False):
+            self.logger.info("lost")
+        self.logger.flush()
+        self.assertEqual(self.logger._take_dropped(), 1)
+
+    def test_queued_lines_are_written(self):
+        self.logger.info("kept")
+        self.logger.flush()
+        with open(self.logger.log_path, encoding="utf-8") as f:
+            self.assertIn("msg=kept", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the SQLite database layer."""
+import math
+import sqlite3
+import tempfile
+import unittest
+
+from backend.db.database import ProjectDatabase, loads_json
+
+
+class ProjectDatabaseTestCase(unittest.TestCase):
+    """Opens a fresh project database per test."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.db = ProjectDatabase.ensure_ready(f"{self._dir.name}/project.db")
+        self.addCleanup(self.db.close)
+
+
+class LegacyJsonTest(ProjectDatabaseTestCase):
+
+    def test_legacy_nan_node_settings_row_loads(self):
+        graph_id = self.db.save_graph("main", {"nodes": [], "edges": []})
+        self.db.save_node_settings(graph_id, "n1", {"plugin_id": "p", "params": {}})
+        # As written by the old json.dumps code path
+        self.db.execute(
+            "UPDATE node_settings SET params_json = ? WHERE node_uid = ?",
+            ('{"threshold": NaN, "limit": Infinity}', "n1")
+        )
+        params = self.db.get_node_settings(graph_id)["n1"]["params"]
+        self.assertTrue(math.isnan(params["threshold"]))
+        self.assertEqual(params["limit"], math.inf)
+
+    def test_bigint_variable_round_trips(self):
+        var_id = self.db.create_project_var("big")["var_id"]
+        self.db.set_project_var_value(var_id, 2 ** 70)
+        value_json = self.db.get_project_var(var_id)["value_json"]
+        self.assertEqual(loads_json(value_json), 2 ** 70)
+        self.assertIsInstance(loads_json(value_json), int)
+
+
+class VarValueTest(ProjectDatabaseTestCase):
+
+    def test_set_returns_stored_json(self):
+        var_id = self.db.create_project_var("x")["var_id"]
+        self.assertEqual(self.db.set_project_var_value(var_id, [1, 2]), "[1,2]")
+
+    def test_set_missing_var_returns_none(self):
+        self.assertIsNone(self.db.set_project_var_value(999, 1))
+
+
+class EnsureReadyTest(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.path = f"{self._dir.name}/project.db"
+
+    def test_populate_commits_with_schema(self):
+        db = ProjectDatabase.ensure_ready(
+            self.path, populate=lambda db: db.save_graph("main", {"nodes": []})
+        )
+        self.addCleanup(db.close)
+        self.assertEqual(db.load_graph("main"), {"nodes": []})
+
+    def test_failed_populate_rolls_back_schema(self):
+        def populate(db):
+            db.save_graph("main", {"nodes": []})
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            ProjectDatabase.ensure_ready(self.path, populate=populate)
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        self.assertEqual(tables, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
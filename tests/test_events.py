@@ -0,0 +1,24 @@
+"""Tests for the runtime event bus."""
+import unittest
+
+from backend.api.events import _drop_superseded
+
+
+def _state(run_id, state, **extra):
+    return dict(type="run_state", run_id=run_id, state=state, **extra)
+
+
+class DropSupersededTest(unittest.TestCase):
+
+    def test_keeps_latest_run_state_per_run(self):
+        status = {"type": "node_status", "node_uid": "a", "status": "ok"}
+        events = [_state("r1", "RUNNING"), status, _state("r2", "RUNNING"), _state("r1", "IDLE")]
+        self.assertEqual(_drop_superseded(events), events[1:])
+
+    def test_keeps_run_state_carrying_node_status(self):
+        events = [_state("r1", "RUNNING", node_uid="a", node_status="ok"), _state("r1", "IDLE")]
+        self.assertEqual(_drop_superseded(events), events)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Tests for the graph executor."""
+import asyncio
+import os
+import tempfile
+import unittest
+
+from backend.db.pool import close_all, get_project_db
+from backend.plugins.loader import load_plugins
+from backend.runtime.executor import GraphExecutor
+
+# Returns the status given in params ("OK" by default)
+_PASS_PLUGIN = '''
+def get_spec():
+    return {"plugin_id": "pass", "name": "Pass", "version": "1.0.0",
+            "description": "", "category": "Test"}
+
+def run(ctx, params, in_data):
+    return {"status": params.get("status", "OK")}
+'''
+
+
+def _node(uid, plugin_id="pass", **params):
+    return {"id": uid, "data": {"plugin_id": plugin_id, "params": params}}
+
+
+def _edge(source, target, branch="ok"):
+    return {"source": source, "target": target, "data": {"branch": branch}}
+
+
+class ExecutorTestCase(unittest.TestCase):
+    """Runs graphs against a temporary project and plugin directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._plugins = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(cls._plugins.name, "pass"))
+        with open(os.path.join(cls._plugins.name, "pass", "plugin.py"), "w") as f:
+            f.write(_PASS_PLUGIN)
+        load_plugins(cls._plugins.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._plugins.cleanup()
+
+    def setUp(self):
+        self._project = tempfile.TemporaryDirectory()
+        self.addCleanup(self._project.cleanup)
+        self.events = []
+        project_dir = self._project.name
+        self.executor = GraphExecutor(
+            project_dir, os.path.join(project_dir, "log.txt"), self.events.append
+        )
+        # Cleanups run last-in first-out: write the log before the directory goes
+        self.addCleanup(self.executor.logger.close)
+
+    def run_graph(self, nodes, edges, **kwargs):
+        return asyncio.run(self.executor.execute({"nodes": nodes, "edges": edges}, **kwargs))
+
+    def finished_nodes(self):
+        return [e["node_uid"] for e in self.events if e["type"] == "node_status"]
+
+
+class FanOutTest(ExecutorTestCase):
+
+    def test_fan_out_runs_every_branch(self):
+        nodes = [_node("a"), _node("b"), _node("c")]
+        edges = [_edge("a", "b"), _edge("a", "c")]
+        result = self.run_graph(nodes, edges, start_node_id="a")
+        self.assertTrue(result["success"])
+        self.assertEqual(sorted(self.finished_nodes()), ["a", "b", "c"])
+
+    def test_disconnected_cycle_keeps_fan_out(self):
+        # q1 <-> q2 cannot be reached from a, so it must not force sequential mode
+        nodes = [_node("a"), _node("b"), _node("c"), _node("q1"), _node("q2")]
+        edges = [_edge("a", "b"), _edge("a", "c"), _edge("q1", "q2"), _edge("q2", "q1")]
+        result = self.run_graph(nodes, edges, start_node_id="a")
+        self.assertTrue(result["success"])
+        self.assertEqual(sorted(self.finished_nodes()), ["a", "b", "c"])
+
+    def test_reachable_cycle_runs_sequentially(self):
+        nodes = [_node("a"), _node("b")]
+        edges = [_edge("a", "b"), _edge("b", "a", "fail")]
+        self.run_graph(nodes, edges, start_node_id="a")
+        self.assertEqual(self.finished_nodes(), ["a", "b"])
+
+
+class StartNodeTest(ExecutorTestCase):
+
+    def test_start_node_passes_through(self):
+        nodes = [_node("s", "__start__"), _node("a")]
+        edges = [_edge("s", "a")]
+        result = self.run_graph(nodes, edges, from_beginning=True)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"]["status"], "OK")
+        self.assertEqual(self.finished_nodes(), ["s", "a"])
+        statuses = [e["status"] for e in self.events if e["type"] == "node_status"]
+        self.assertEqual(statuses, ["ok", "ok"])
+
+
+class VariableCacheTest(ExecutorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(close_all)
+
+    def set_variable(self, ref, value):
+        async def run():
+            self.executor._loop = asyncio.get_running_loop()
+            await self.executor._set_variable_value(ref, value)
+        asyncio.run(run())
+
+    def test_written_value_is_cached(self):
+        var_id = get_project_db(self._project.name).create_project_var("x")["var_id"]
+        self.set_variable(f"proj:{var_id}", 5)
+        self.assertEqual(self.executor._var_cache[("proj", var_id)], "5")
+
+    def test_missing_variable_is_not_cached(self):
+        self.executor._var_cache[("proj", 999)] = "1"
+        self.set_variable("proj:999", 5)
+        self.assertNotIn(("proj", 999), self.executor._var_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
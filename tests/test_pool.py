@@ -0,0 +1,42 @@
+"""Tests for the process-wide database handle cache."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from backend.db import pool
+
+
+class HandleEvictionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.addCleanup(pool.close_all)
+        patcher = mock.patch.object(pool, "MAX_HANDLES", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def project(self, name):
+        return os.path.join(self._dir.name, name)
+
+    def test_least_recently_used_handle_is_evicted(self):
+        a = pool.get_project_db(self.project("a"))
+        pool.get_project_db(self.project("b"))
+        self.assertIs(pool.get_project_db(self.project("a")), a)
+        pool.get_project_db(self.project("c"))
+        self.assertEqual(
+            [os.path.basename(os.path.dirname(p)) for p in pool._handles], ["a", "c"]
+        )
+
+    def test_evicted_handle_still_works(self):
+        a = pool.get_project_db(self.project("a"))
+        pool.get_project_db(self.project("b"))
+        pool.get_project_db(self.project("c"))
+        graph_id = a.save_graph("main", {"nodes": []})
+        self.assertEqual(a.load_graph("main"), {"nodes": []})
+        self.assertIsNotNone(graph_id)
+
+
+if __name__ == "__main__":
+    unittest.main()